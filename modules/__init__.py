@@ -3,19 +3,46 @@ Modules Package - Brain Module System v4.0
 Main package containing core, ui, and utils modules
 """
 
-from .core import Config, Installer, StatusChecker
-from .ui import UIBuilder, themes
-from .utils import (
-    LogManager,
-    is_admin,
-    run_as_admin,
-    add_to_system_path,
-    add_to_path_immediate,
-    PathOperations,
-    RegistryOperations,
-    BroadcastManager,
-    PowerShellIntegration
-)
+import importlib
+
+# Subpackages load on first attribute access (PEP 562), so importing e.g.
+# modules.utils.logger does not pull in core/ui or the Windows path helpers
+_LAZY_ATTRS = {
+    # Core modules
+    'Config': '.core',
+    'Installer': '.core',
+    'StatusChecker': '.core',
+
+    # UI modules
+    'UIBuilder': '.ui',
+    'themes': '.ui',
+
+    # Utils
+    'LogManager': '.utils',
+    'is_admin': '.utils',
+    'run_as_admin': '.utils',
+    'add_to_system_path': '.utils',
+    'add_to_path_immediate': '.utils',
+    'PathOperations': '.utils',
+    'RegistryOperations': '.utils',
+    'BroadcastManager': '.utils',
+    'PowerShellIntegration': '.utils',
+}
+
+
+def __getattr__(name):
+    """Resolve subpackage attributes on first access (PEP 562)"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Core modules
@@ -4,6 +4,7 @@ Consolidated configuration from modules/config.py and main_modules/config.py
 Brain Module System v4.0 - Central configuration management
 """
 
+import functools
 import os
 import subprocess
 
@@ -139,6 +140,12 @@ class Config:
         return cls.INFO_MESSAGES.get(message_key, message_key).format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1)
+def get_default_config():
+    """Return the shared Config instance used when no config is injected"""
+    return Config()
+
+
 try:
     config = Config()
 except Exception as e:
@@ -149,4 +156,4 @@ except Exception as e:
         get_subprocess_flags = lambda self: __import__('subprocess').CREATE_NO_WINDOW
     config = MinimalConfig()
 
-__all__ = ['Config', 'config']
\ No newline at end of file
+__all__ = ['Config', 'config', 'get_default_config']
\ No newline at end of file
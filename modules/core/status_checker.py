@@ -3,6 +3,7 @@ Unified Status Checker Module - Facade Pattern
 Brain Module System v4.0 - Refactored for modularity
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any
 from modules.core.config import Config
 from modules.core.exceptions import ToolCheckError
@@ -28,8 +29,6 @@ class StatusChecker:
             config: Configuration object (optional, uses default if None)
         """
         self.config = config or Config()
-        self._cache = {}
-        self._cache_enabled = True
 
         # Initialize all checker components
         self.git_checker = GitChecker(self.config)
@@ -39,6 +38,19 @@ class StatusChecker:
         self.gemini_checker = GeminiCliChecker()
         self.system_explorer = SystemExplorer()
 
+        # Shared pool for independent subprocess/registry probes
+        self._executor = ThreadPoolExecutor(max_workers=8)
+
+    def close(self):
+        """Shut down the shared probe executor"""
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._executor = None
+
+    def __del__(self):
+        self.close()
+
     # Git delegation methods
     def is_git_installed(self) -> bool:
         """Delegate to GitChecker"""
@@ -131,28 +143,53 @@ class StatusChecker:
         return self.pm_checker.get_npm_global_packages()
 
     def get_detailed_git_status(self) -> Dict[str, Any]:
-        """Get detailed Git installation status"""
+        """Get detailed Git installation status (probes run in parallel)"""
+        submit = self._executor.submit
+        installed = submit(self.is_git_installed)
+        version = submit(self.get_git_version)
+        installations = submit(self._find_git_installations)
+        system_path = submit(self._get_system_path)
+        user_path = submit(self._get_user_path)
+
+        git_installed = installed.result()
         return {
-            'installed': self.is_git_installed(),
-            'version': self.get_git_version(),
-            'installations': self._find_git_installations(),
-            'config': self._get_git_config() if self.is_git_installed() else {},
-            'system_path': self._get_system_path(),
-            'user_path': self._get_user_path()
+            'installed': git_installed,
+            'version': version.result(),
+            'installations': installations.result(),
+            'config': self._get_git_config() if git_installed else {},
+            'system_path': system_path.result(),
+            'user_path': user_path.result()
         }
 
     def get_detailed_nodejs_status(self) -> Dict[str, Any]:
-        """Get detailed Node.js installation status"""
+        """Get detailed Node.js installation status (probes run in parallel)"""
+        submit = self._executor.submit
+        node_installed = submit(self.is_nodejs_installed)
+        node_version = submit(self.get_nodejs_version)
+        npm_installed = submit(self.is_npm_installed)
+        npm_version = submit(self.get_npm_version)
+        installations = submit(self._find_nodejs_installations)
+        system_path = submit(self._get_system_path)
+        user_path = submit(self._get_user_path)
+
+        # npm-dependent probes only run once npm presence is known
+        if npm_installed.result():
+            npm_config = submit(self._get_npm_config)
+            global_packages = submit(self._get_npm_global_packages)
+            npm_config, global_packages = npm_config.result(), global_packages.result()
+        else:
+            npm_config, global_packages = {}, []
+
         return {
-            'node_installed': self.is_nodejs_installed(),
-            'node_version': self.get_nodejs_version(),
-            'npm_installed': self.is_npm_installed(),
-            'npm_version': self.get_npm_version(),
-            'installations': self._find_nodejs_installations(),
-            'npm_config': self._get_npm_config() if self.is_npm_installed() else {},
-            'global_packages': self._get_npm_global_packages() if self.is_npm_installed() else [],
-            'system_path': self._get_system_path(),
-            'user_path': self._get_user_path()
+            'node_installed': node_installed.result(),
+            'node_version': node_version.result(),
+            'npm_installed': npm_installed.result(),
+            'npm_version': npm_version.result(),
+            'installations': installations.result(),
+            'npm_config': npm_config,
+            'global_packages': global_packages,
+            'system_path': system_path.result(),
+            'user_path': user_path.result()
         }
 
     def check_all(self) -> Dict[str, Any]:
@@ -227,19 +264,6 @@ class StatusChecker:
             }
         }
 
-    def clear_cache(self):
-        """Clear internal cache"""
-        self._cache.clear()
-
-    def disable_cache(self):
-        """Disable caching for fresh checks"""
-        self._cache_enabled = False
-        self.clear_cache()
-
-    def enable_cache(self):
-        """Enable caching for performance"""
-        self._cache_enabled = True
-
 
 # Export for backward compatibility
 __all__ = ['StatusChecker', 'check_command_exists']
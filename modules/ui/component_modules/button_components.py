@@ -5,6 +5,7 @@ Brain Module System v4.0
 """
 
 import tkinter as tk
+from modules.core.config import get_default_config
 
 
 class ButtonComponentBuilder:
@@ -12,8 +13,7 @@ class ButtonComponentBuilder:
 
     def __init__(self, config=None):
         """Initialize with configuration instance"""
-        from modules.core.config import Config
-        self.config = config if config is not None else Config()
+        self.config = config if config is not None else get_default_config()
 
     def create_install_buttons(self, parent, callback_dict):
         """Create installation buttons frame with callbacks and config-based colors"""
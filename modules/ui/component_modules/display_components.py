@@ -6,6 +6,7 @@ Brain Module System v4.0
 
 import tkinter as tk
 from tkinter import scrolledtext
+from modules.core.config import get_default_config
 
 
 class DisplayComponentBuilder:
@@ -13,8 +14,7 @@ class DisplayComponentBuilder:
 
     def __init__(self, config=None):
         """Initialize with configuration instance"""
-        from modules.core.config import Config
-        self.config = config if config is not None else Config()
+        self.config = config if config is not None else get_default_config()
 
     def create_log_window(self, parent):
         """Create log text area with scrollbar and config-based colors"""
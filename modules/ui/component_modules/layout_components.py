@@ -6,6 +6,7 @@ Brain Module System v4.0
 
 import tkinter as tk
 from tkinter import ttk
+from modules.core.config import get_default_config
 
 
 class LayoutComponentBuilder:
@@ -13,8 +14,7 @@ class LayoutComponentBuilder:
 
     def __init__(self, config=None):
         """Initialize with configuration instance"""
-        from modules.core.config import Config
-        self.config = config if config is not None else Config()
+        self.config = config if config is not None else get_default_config()
 
     def create_scrollable_container(self, parent):
         """Create scrollable container with canvas and scrollbar"""
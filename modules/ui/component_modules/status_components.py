@@ -5,6 +5,7 @@ Brain Module System v4.0
 """
 
 import tkinter as tk
+from modules.core.config import get_default_config
 
 
 class StatusComponentBuilder:
@@ -12,8 +13,7 @@ class StatusComponentBuilder:
 
     def __init__(self, config=None):
         """Initialize with configuration instance"""
-        from modules.core.config import Config
-        self.config = config if config is not None else Config()
+        self.config = config if config is not None else get_default_config()
 
     def create_status_frame(self, parent):
         """Create status display frame for tool installation status"""
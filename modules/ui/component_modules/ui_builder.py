@@ -5,6 +5,7 @@ Brain Module System v4.0
 """
 
 import tkinter as tk
+from modules.core.config import get_default_config
 from .status_components import StatusComponentBuilder
 from .button_components import ButtonComponentBuilder
 from .display_components import DisplayComponentBuilder
@@ -16,8 +17,7 @@ class CompleteUIBuilder:
 
     def __init__(self, config=None):
         """Initialize with configuration and component builders"""
-        from modules.core.config import Config
-        self.config = config if config is not None else Config()
+        self.config = config if config is not None else get_default_config()
 
         # Initialize all component builders
         self.status_builder = StatusComponentBuilder(self.config)
@@ -3,26 +3,65 @@ Utils Module Package for AI Setup Application
 Provides system utilities, path management, and logging functionality
 """
 
-# Import key classes and functions for easy access
+import importlib
+
+# LogManager is cheap to import (os/time only), so keep it eager
 from .logger import LogManager
-from .system_utils import (
-    is_admin, run_as_admin, restart_as_admin,
-    check_software_installed, check_package_manager,
-    run_command_with_timeout, check_multiple_software_installations,
-    find_executable_in_common_paths, search_drives_for_executable,
-    ensure_directory_exists, get_windows_version
-)
-from .path_manager import (
-    # Basic functions
-    add_to_system_path, add_multiple_paths_to_system_path,
-    get_system_path_from_registry, get_user_path_from_registry,
-    refresh_environment_variables, broadcast_environment_change,
-    set_environment_variable, check_path_in_environment,
-    # Enhanced functions
-    add_to_path_immediate, check_and_set_powershell_execution_policy,
-    # Classes
-    PathOperations, RegistryOperations, BroadcastManager, PowerShellIntegration
-)
+
+# Heavier submodules (ctypes/wintypes/winreg/platform) load on first attribute access
+_LAZY_ATTRS = {
+    # System utilities
+    'is_admin': '.system_utils',
+    'run_as_admin': '.system_utils',
+    'restart_as_admin': '.system_utils',
+    'check_software_installed': '.system_utils',
+    'check_package_manager': '.system_utils',
+    'run_command_with_timeout': '.system_utils',
+    'check_multiple_software_installations': '.system_utils',
+    'find_executable_in_common_paths': '.system_utils',
+    'search_drives_for_executable': '.system_utils',
+    'ensure_directory_exists': '.system_utils',
+    'get_windows_version': '.system_utils',
+
+    # Path management (basic)
+    'add_to_system_path': '.path_manager',
+    'add_multiple_paths_to_system_path': '.path_manager',
+    'get_system_path_from_registry': '.path_manager',
+    'get_user_path_from_registry': '.path_manager',
+    'refresh_environment_variables': '.path_manager',
+    'broadcast_environment_change': '.path_manager',
+    'set_environment_variable': '.path_manager',
+    'check_path_in_environment': '.path_manager',
+    'check_paths_in_environment': '.path_manager',
+
+    # Path management (enhanced)
+    'add_to_path_immediate': '.path_manager',
+    'check_and_set_powershell_execution_policy': '.path_manager',
+
+    # Path management (classes)
+    'PathOperations': '.path_manager',
+    'RegistryOperations': '.path_manager',
+    'BroadcastManager': '.path_manager',
+    'PowerShellIntegration': '.path_manager',
+
+    # Error logging
+    'ErrorLogManager': '.error_logger',
+}
+
+
+def __getattr__(name):
+    """Resolve heavy submodule attributes on first access (PEP 562)"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Logger
@@ -40,10 +79,14 @@ __all__ = [
     'get_system_path_from_registry', 'get_user_path_from_registry',
     'refresh_environment_variables', 'broadcast_environment_change',
     'set_environment_variable', 'check_path_in_environment',
+    'check_paths_in_environment',
 
     # Path management (enhanced)
     'add_to_path_immediate', 'check_and_set_powershell_execution_policy',
 
     # Path management (classes)
-    'PathOperations', 'RegistryOperations', 'BroadcastManager', 'PowerShellIntegration'
-]
\ No newline at end of file
+    'PathOperations', 'RegistryOperations', 'BroadcastManager', 'PowerShellIntegration',
+
+    # Error logging
+    'ErrorLogManager'
+]
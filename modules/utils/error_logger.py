@@ -6,11 +6,41 @@
 import os
 import sys
 import platform
+import time
 import traceback
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
 
+def _detect_admin() -> bool:
+    """관리자 권한 여부 확인 (프로세스당 한 번만 호출)"""
+    try:
+        import ctypes
+        is_user_an_admin = ctypes.windll.shell32.IsUserAnAdmin
+        is_user_an_admin.restype = ctypes.c_int
+        return bool(is_user_an_admin())
+    except:
+        return False
+
+
+# 저장 시마다 다시 만들지 않도록 고정 헤더/푸터를 미리 조립
+_HEADER_RULE = "=" * 70 + "\n"
+_HEADER = _HEADER_RULE + "AI 개발 환경 자동 설치 - 에러 로그\n" + _HEADER_RULE
+_FOOTER = (
+    _HEADER_RULE
+    + "문제가 지속될 경우, 이 로그 파일을 아래 이메일로 보내주세요:\n"
+    + "📧 yangheewoo5511@gmail.com\n"
+    + "   (문제 상황 설명과 함께 첨부 부탁드립니다)\n"
+    + _HEADER_RULE
+)
+
+# 로그 레벨별 출력 접두어
+_LEVEL_PREFIX = {"ERROR": "❌ ", "WARNING": "⚠️ "}
+
+# 관리자 권한은 프로세스 수명 동안 바뀌지 않으므로 import 시점에 한 번만 확인
+_IS_ADMIN = _detect_admin()
+
+
 class ErrorLogManager:
     """설치 실패 시 에러 로그를 파일로 저장하는 관리자 클래스"""
 
@@ -37,24 +67,29 @@ class ErrorLogManager:
         # 에러 발생 여부
         self.error_occurred = False
 
+        # 레벨별 누적 개수 (요약 시 재집계하지 않도록 유지)
+        self._error_count = 0
+        self._warning_count = 0
+
         # 시스템 정보 수집
         self.system_info = self._collect_system_info()
 
-        # 에러 상세 정보
-        self.error_details: List[Dict] = []
+        # 에러 상세 정보 (항목별 병렬 리스트로 저장)
+        self._err_step: List[str] = []
+        self._err_msg: List[str] = []
+        self._err_tb: List[Optional[str]] = []
+        self._err_ts: List[str] = []
+
+        # 초 단위로 캐시한 로그 타임스탬프
+        self._ts_cache_sec = 0
+        self._ts_cache_str = ""
 
     def _collect_system_info(self) -> Dict[str, str]:
         """시스템 정보 수집"""
-        try:
-            import ctypes
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            is_admin = False
-
         return {
             'os': f"{platform.system()} {platform.release()} ({platform.version()})",
             'python_version': sys.version.split()[0],
-            'is_admin': str(is_admin),
+            'is_admin': str(_IS_ADMIN),
             'exe_path': sys.executable if getattr(sys, 'frozen', False) else 'Development Mode',
             'working_dir': os.getcwd(),
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -68,12 +103,20 @@ class ErrorLogManager:
             message: 로그 메시지
             level: 로그 레벨 (INFO, WARNING, ERROR)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        sec = int(time.time())
+        if sec != self._ts_cache_sec:
+            self._ts_cache_sec = sec
+            lt = time.localtime(sec)
+            self._ts_cache_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        timestamp = self._ts_cache_str
         self.log_entries.append((timestamp, level, message))
 
         # 에러 레벨인 경우 플래그 설정
         if level == "ERROR":
+            self._error_count += 1
             self.error_occurred = True
+        elif level == "WARNING":
+            self._warning_count += 1
 
     def add_error_detail(self, step: str, error_message: str, traceback_info: Optional[str] = None):
         """
@@ -82,16 +125,26 @@ class ErrorLogManager:
         Args:
             step: 실패한 단계
             error_message: 에러 메시지
-            traceback_info: 스택 트레이스 정보
+            traceback_info: 스택 트레이스 정보 (None이고 처리 중인 예외가 있으면 자동 수집)
         """
-        self.error_details.append({
-            'step': step,
-            'error_message': error_message,
-            'traceback': traceback_info,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
+        # 트레이스가 주어지지 않았고 except 블록 안에서 호출된 경우에만 포맷
+        if traceback_info is None and sys.exc_info()[0] is not None:
+            traceback_info = traceback.format_exc()
+
+        self._err_step.append(sys.intern(step))
+        self._err_msg.append(error_message)
+        self._err_tb.append(traceback_info)
+        self._err_ts.append(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         self.error_occurred = True
 
+    @property
+    def error_details(self) -> List[Dict]:
+        """에러 상세 정보를 딕셔너리 리스트로 반환 (호환용)"""
+        return [
+            {'step': step, 'error_message': msg, 'traceback': tb, 'timestamp': ts}
+            for step, msg, tb, ts in zip(self._err_step, self._err_msg, self._err_tb, self._err_ts)
+        ]
+
     def save_error_log(self) -> Optional[str]:
         """
         에러 로그 파일 저장 (실패 시에만)
@@ -109,51 +162,47 @@ class ErrorLogManager:
             log_filename = f"ai_setup_error_{timestamp}.log"
             log_filepath = os.path.join(self.exe_dir, log_filename)
 
-            # 로그 내용 작성
-            with open(log_filepath, 'w', encoding='utf-8') as f:
-                # 헤더
-                f.write("=" * 70 + "\n")
-                f.write("AI 개발 환경 자동 설치 - 에러 로그\n")
-                f.write("=" * 70 + "\n")
-                f.write(f"생성 시간: {self.system_info['timestamp']}\n")
-                f.write(f"설치 실행 파일: {self.system_info['exe_path']}\n\n")
-
-                # 시스템 정보
-                f.write("[시스템 정보]\n")
-                f.write(f"- OS: {self.system_info['os']}\n")
-                f.write(f"- Python 버전: {self.system_info['python_version']}\n")
-                f.write(f"- 관리자 권한: {self.system_info['is_admin']}\n")
-                f.write(f"- 실행 경로: {self.system_info['working_dir']}\n\n")
-
-                # 설치 진행 로그
-                f.write("[설치 진행 로그]\n")
-                for timestamp, level, message in self.log_entries:
-                    prefix = ""
-                    if level == "ERROR":
-                        prefix = "❌ "
-                    elif level == "WARNING":
-                        prefix = "⚠️ "
-                    f.write(f"[{timestamp}] {prefix}{message}\n")
-                f.write("\n")
-
-                # 에러 상세 정보
-                if self.error_details:
-                    f.write("[에러 상세]\n")
-                    for idx, error in enumerate(self.error_details, 1):
-                        f.write(f"\n--- 에러 #{idx} ---\n")
-                        f.write(f"발생 시각: {error['timestamp']}\n")
-                        f.write(f"실패 단계: {error['step']}\n")
-                        f.write(f"에러 메시지: {error['error_message']}\n")
-                        if error.get('traceback'):
-                            f.write(f"스택 트레이스:\n{error['traceback']}\n")
-                    f.write("\n")
-
-                # 푸터
-                f.write("=" * 70 + "\n")
-                f.write("문제가 지속될 경우, 이 로그 파일을 아래 이메일로 보내주세요:\n")
-                f.write("📧 yangheewoo5511@gmail.com\n")
-                f.write("   (문제 상황 설명과 함께 첨부 부탁드립니다)\n")
-                f.write("=" * 70 + "\n")
+            # 로그 내용을 메모리에서 조립한 뒤 한 번에 기록
+            parts = []
+            append = parts.append
+
+            # 헤더
+            append(_HEADER)
+            append(f"생성 시간: {self.system_info['timestamp']}\n")
+            append(f"설치 실행 파일: {self.system_info['exe_path']}\n\n")
+
+            # 시스템 정보
+            append("[시스템 정보]\n")
+            append(f"- OS: {self.system_info['os']}\n")
+            append(f"- Python 버전: {self.system_info['python_version']}\n")
+            append(f"- 관리자 권한: {self.system_info['is_admin']}\n")
+            append(f"- 실행 경로: {self.system_info['working_dir']}\n\n")
+
+            # 설치 진행 로그
+            append("[설치 진행 로그]\n")
+            get_prefix = _LEVEL_PREFIX.get
+            for timestamp, level, message in self.log_entries:
+                append(f"[{timestamp}] {get_prefix(level, '')}{message}\n")
+            append("\n")
+
+            # 에러 상세 정보
+            if self._err_step:
+                append("[에러 상세]\n")
+                err_step, err_msg, err_tb, err_ts = self._err_step, self._err_msg, self._err_tb, self._err_ts
+                for i in range(len(err_step)):
+                    append(f"\n--- 에러 #{i + 1} ---\n")
+                    append(f"발생 시각: {err_ts[i]}\n")
+                    append(f"실패 단계: {err_step[i]}\n")
+                    append(f"에러 메시지: {err_msg[i]}\n")
+                    if err_tb[i]:
+                        append(f"스택 트레이스:\n{err_tb[i]}\n")
+                append("\n")
+
+            # 푸터
+            append(_FOOTER)
+
+            with open(log_filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write("".join(parts))
 
             return log_filepath
 
@@ -164,11 +213,8 @@ class ErrorLogManager:
 
     def get_log_summary(self) -> str:
         """로그 요약 반환"""
-        error_count = sum(1 for _, level, _ in self.log_entries if level == "ERROR")
-        warning_count = sum(1 for _, level, _ in self.log_entries if level == "WARNING")
-
         return (
             f"총 로그 항목: {len(self.log_entries)}\n"
-            f"에러: {error_count}개\n"
-            f"경고: {warning_count}개"
+            f"에러: {self._error_count}개\n"
+            f"경고: {self._warning_count}개"
         )
@@ -3,8 +3,14 @@ Logger Module for AI Setup Tool
 Manages logging functionality for the GUI application
 """
 
-import datetime
+import collections
+import itertools
 import os
+import time
+
+
+# Severity ranks used to decide which levels reach the log widget
+_LEVEL_RANK = {'DEBUG': 0, 'INFO': 1, 'SUCCESS': 1, 'WARNING': 2, 'ERROR': 3}
 
 
 class LogManager:
@@ -23,7 +29,24 @@ class LogManager:
         """
         self.log_widget = log_widget
         self.enable_timestamp = enable_timestamp
-        self.log_history = []
+
+        # Levels below this are kept in history only, without widget output
+        self.min_level = 'INFO'
+        self._min_rank = _LEVEL_RANK[self.min_level]
+
+        # Preallocated history buffer; only the first _n slots are live
+        self._capacity = 1024
+        self.log_history = [None] * self._capacity
+        self._n = 0
+
+        # Widget output is batched and flushed on a short Tk timer
+        self.flush_interval_ms = 50
+        self._pending = collections.deque()
+        self._flush_scheduled = False
+
+        # Formatted timestamp cached per wall-clock second
+        self._ts_cache_sec = 0
+        self._ts_cache_str = ""
 
         # Define color mapping for different log levels
         self.level_colors = {
@@ -34,6 +57,9 @@ class LogManager:
             'DEBUG': '#808080'      # Gray
         }
 
+        # Prebuilt "[LEVEL] " prefixes so log() assembles one string per call
+        self._level_prefixes = {level: f"[{level}] " for level in self.level_colors}
+
         # Configure text widget tags for colored text (prepare for future use)
         self._configure_text_tags()
 
@@ -43,8 +69,16 @@ class LogManager:
             self.log_widget.tag_configure(level, foreground=color)
 
     def _get_timestamp(self):
-        """Get current timestamp string."""
-        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Get current timestamp string (reformatted at most once per second)."""
+        sec = int(time.time())
+        if sec != self._ts_cache_sec:
+            self._ts_cache_sec = sec
+            lt = time.localtime(sec)
+            self._ts_cache_str = (
+                f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} "
+                f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+            )
+        return self._ts_cache_str
 
     def log(self, message, level='INFO'):
         """
@@ -54,32 +88,71 @@ class LogManager:
             message (str): Message to log
             level (str): Log level (INFO, WARNING, ERROR, SUCCESS, DEBUG)
         """
-        if level.upper() not in self.level_colors:
-            level = 'INFO'
+        level = level.upper()
+        prefix = self._level_prefixes.get(level)
+        if prefix is None:
+            level, prefix = 'INFO', self._level_prefixes['INFO']
 
+        if _LEVEL_RANK[level] < self._min_rank:
+            self._log_buffer_only(f"{prefix}{message}")
+        else:
+            self._log_full(prefix, message)
+
+    def _append_history(self, entry):
+        """Append an entry to the history buffer, doubling it only when full."""
+        if self._n == self._capacity:
+            self.log_history.extend([None] * self._capacity)
+            self._capacity *= 2
+        self.log_history[self._n] = entry
+        self._n += 1
+
+    def _log_buffer_only(self, entry):
+        """Record a suppressed-level entry in history without timestamp or widget output."""
+        self._append_history(entry)
+
+    def _log_full(self, prefix, message):
+        """Format a message with timestamp, record it and queue it for the widget."""
         # Format message with timestamp if enabled
         if self.enable_timestamp:
-            formatted_message = f"[{self._get_timestamp()}] [{level.upper()}] {message}"
+            formatted_message = f"[{self._get_timestamp()}] {prefix}{message}"
         else:
-            formatted_message = f"[{level.upper()}] {message}"
-
-        # Add to log history
-        self.log_history.append(formatted_message)
-
-        # Insert message into log widget
-        self.log_widget.insert('end', f"{formatted_message}\n")
-        self.log_widget.see('end')
-
-        # Update the GUI to show the new message
+            formatted_message = f"{prefix}{message}"
+
+        self._append_history(formatted_message)
+
+        # Queue message for the next batched widget insert
+        self._pending.append(f"{formatted_message}\n")
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            try:
+                self.log_widget.after(self.flush_interval_ms, self.flush)
+            except:
+                self._flush_scheduled = False  # Handle case where widget is destroyed
+
+    def flush(self):
+        """Insert all pending messages into the log widget in a single update."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+
+        text = "".join(self._pending)
+        self._pending.clear()
         try:
+            self.log_widget.insert('end', text)
+            self.log_widget.see('end')
+
+            # Update the GUI to show the new messages
             self.log_widget.update_idletasks()
         except:
             pass  # Handle case where widget is destroyed
 
     def clear(self):
         """Clear all log messages from the widget and history."""
+        self._pending.clear()
         self.log_widget.delete('1.0', 'end')
-        self.log_history.clear()
+        # Keep the allocated buffer for reuse; drop references to old entries
+        self.log_history[:self._n] = [None] * self._n
+        self._n = 0
 
     def save_to_file(self, filepath):
         """
@@ -91,6 +164,7 @@ class LogManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        self.flush()
         try:
             # Ensure directory exists
             directory = os.path.dirname(filepath)
@@ -98,12 +172,12 @@ class LogManager:
                 os.makedirs(directory)
 
             # Write log history to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"Log file generated on: {self._get_timestamp()}\n")
-                f.write("=" * 50 + "\n\n")
-
-                for log_entry in self.log_history:
-                    f.write(log_entry + "\n")
+            header = f"Log file generated on: {self._get_timestamp()}\n" + "=" * 50 + "\n\n"
+            body = "\n".join(self.get_log_history_view())
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 17) as f:
+                f.write(header)
+                if body:
+                    f.write(body + "\n")
 
             return True
 
@@ -113,12 +187,32 @@ class LogManager:
 
     def get_log_count(self):
         """Get the number of log entries."""
-        return len(self.log_history)
+        return self._n
 
     def get_log_history(self):
         """Get a copy of the log history."""
-        return self.log_history.copy()
+        return self.log_history[:self._n]
+
+    def get_log_history_view(self):
+        """Get a read-only iterator over the current log history without copying it."""
+        return itertools.islice(self.log_history, self._n)
+
+    def take_log_history(self):
+        """Hand off the log history to the caller and start a fresh one."""
+        history = self.log_history
+        del history[self._n:]
+        self.log_history = [None] * self._capacity
+        self._n = 0
+        return history
 
     def set_timestamp_enabled(self, enabled):
         """Enable or disable timestamp for future log messages."""
-        self.enable_timestamp = enabled
\ No newline at end of file
+        self.enable_timestamp = enabled
+
+    def set_min_level(self, level):
+        """Set the lowest level shown in the log widget (lower levels stay in history only)."""
+        level = level.upper()
+        if level not in _LEVEL_RANK:
+            level = 'INFO'
+        self.min_level = level
+        self._min_rank = _LEVEL_RANK[level]
\ No newline at end of file
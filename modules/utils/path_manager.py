@@ -8,85 +8,106 @@ from typing import List, Optional, Dict
 from .path_operations.registry_operations import RegistryOperations
 from .path_operations.broadcast_manager import BroadcastManager
 from .path_operations.powershell_integration import PowerShellIntegration
-from .path_operations.path_operations import PathOperations
+from .path_operations.path_operations import PathOperations, _default_ops
+
+
+# Shared component instances - avoid re-binding Windows APIs on every call
+
+def _ops() -> PathOperations:
+    return _default_ops()
+
+
+def _reg() -> RegistryOperations:
+    return _ops().registry_ops
+
+
+def _bc() -> BroadcastManager:
+    return _ops().broadcast_mgr
+
+
+def _ps() -> PowerShellIntegration:
+    return _ops().powershell
 
 
 # Backward compatibility functions - re-export from PathOperations
 
 def add_to_system_path(path: str) -> bool:
     """Add to system PATH - basic mode"""
-    ops = PathOperations()
-    return ops.add_to_system_path(path)
+    return _ops().add_to_system_path(path)
 
 
-def add_multiple_paths_to_system_path(new_paths: List[str]) -> bool:
-    """Add multiple paths to system PATH"""
-    ops = PathOperations()
-    return ops.add_multiple_paths_to_system_path(new_paths)
+def add_multiple_paths_to_system_path(new_paths: List[str], final: bool = True) -> bool:
+    """Add multiple paths to system PATH (final=False defers the broadcast to the next final update)"""
+    return _ops().add_multiple_paths_to_system_path(new_paths, final)
 
 
 def add_to_path_immediate(paths) -> bool:
     """Add to PATH with immediate effect - enhanced mode"""
-    ops = PathOperations()
-    return ops.add_to_path_immediate(paths)
+    return _ops().add_to_path_immediate(paths)
 
 
 def add_to_user_path_immediate(paths) -> bool:
     """Add to user PATH with immediate effect - enhanced mode"""
-    ops = PathOperations()
-    return ops.add_to_user_path_immediate(paths)
+    return _ops().add_to_user_path_immediate(paths)
 
 
 def remove_from_system_path(path: str) -> bool:
     """Remove from system PATH"""
-    ops = PathOperations()
-    return ops.remove_from_path(path)
+    return _ops().remove_from_path(path)
 
 
 def get_system_path_from_registry() -> List[str]:
     """Get current system PATH"""
-    ops = PathOperations()
-    return ops.get_current_path()
+    return _ops().get_current_path()
 
 
 def get_user_path_from_registry() -> List[str]:
     """Get current user PATH"""
-    reg_ops = RegistryOperations()
-    return reg_ops.read_user_path()
+    return _reg().read_user_path()
 
 
-def refresh_environment_variables() -> bool:
+def refresh_environment_variables(system: bool = True, user: bool = True) -> bool:
     """Refresh environment variables for current process"""
-    ops = PathOperations()
-    return ops.refresh_environment_variables()
+    return _ops().refresh_environment_variables(system, user)
 
 
 def broadcast_environment_change() -> bool:
     """Broadcast environment variable changes to the system"""
-    broadcast_mgr = BroadcastManager()
-    return broadcast_mgr.broadcast_environment_change()
+    return _bc().broadcast_environment_change()
+
+
+def flush_broadcast() -> bool:
+    """Send any pending debounced environment change broadcast now"""
+    return _bc().flush_broadcast()
 
 
 def check_path_in_environment(target_path: str, case_sensitive: bool = False) -> Dict:
     """Check if a path exists in environment PATH"""
-    ops = PathOperations()
-    return ops.check_path_in_environment(target_path, case_sensitive)
+    return _ops().check_path_in_environment(target_path, case_sensitive)
+
+
+def check_paths_in_environment(targets: List[str], case_sensitive: bool = False) -> Dict[str, Dict]:
+    """Check several paths against environment PATH with one registry read"""
+    return _ops().check_paths_in_environment(targets, case_sensitive)
 
 
 def set_environment_variable(name: str, value: str, user: bool = False) -> bool:
-    """Set an environment variable in the registry"""
-    reg_ops = RegistryOperations()
-    if reg_ops.write_environment_variable(name, value, user):
-        broadcast_mgr = BroadcastManager()
-        broadcast_mgr.broadcast_environment_change()
+    """Set an environment variable in the registry (broadcast is debounced, flushed at exit at the latest)"""
+    if _reg().write_environment_variable(name, value, user):
+        # Debounced - consecutive writes share one broadcast
+        _bc().request_broadcast()
         return True
     return False
 
 
+def registry_session():
+    """Context manager keeping the Environment registry keys open across several operations"""
+    return _reg().session()
+
+
 def check_and_set_powershell_execution_policy() -> bool:
     """Check and set PowerShell execution policy to RemoteSigned if needed"""
-    powershell = PowerShellIntegration()
-    return powershell.ensure_execution_policy()
+    return _ps().ensure_execution_policy()
 
 
 # Export all for backward compatibility
@@ -104,8 +125,11 @@ __all__ = [
     'get_user_path_from_registry',
     'refresh_environment_variables',
     'broadcast_environment_change',
+    'flush_broadcast',
     'set_environment_variable',
+    'registry_session',
     'check_path_in_environment',
+    'check_paths_in_environment',
 
     # Enhanced functions
     'add_to_path_immediate',
@@ -4,7 +4,9 @@ Windows message broadcasting for environment changes
 Brain Module System v4.0
 """
 
+import atexit
 import ctypes
+import threading
 from ctypes import wintypes
 from typing import Optional
 
@@ -15,47 +17,82 @@ WM_SETTINGCHANGE = 0x001A
 SMTO_ABORTIFHUNG = 0x0002
 SMTO_BLOCK = 0x0001
 
+# 일반 브로드캐스트에서 창 하나당 응답을 기다리는 시간(ms) - 응답 없는 창은 건너뜀
+QUICK_BROADCAST_TIMEOUT_MS = 1000
+
+# 연속된 환경 변경을 하나의 브로드캐스트로 묶는 대기 시간(초)
+BROADCAST_DEBOUNCE_SECONDS = 0.2
+
+
+def _bind_user32():
+    """Load user32 once and configure broadcast function prototypes"""
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+    # SendMessageTimeoutW 함수 설정
+    send_message_timeout = user32.SendMessageTimeoutW
+    send_message_timeout.argtypes = [
+        wintypes.HWND,      # hWnd
+        wintypes.UINT,      # Msg
+        wintypes.WPARAM,    # wParam
+        wintypes.LPVOID,    # lParam
+        wintypes.UINT,      # fuFlags
+        wintypes.UINT,      # uTimeout
+        ctypes.POINTER(wintypes.DWORD)  # lpdwResult
+    ]
+    send_message_timeout.restype = wintypes.LPARAM
+
+    # PostMessageW 함수 설정
+    post_message = user32.PostMessageW
+    post_message.argtypes = [
+        wintypes.HWND,      # hWnd
+        wintypes.UINT,      # Msg
+        wintypes.WPARAM,    # wParam
+        wintypes.LPARAM     # lParam
+    ]
+    post_message.restype = wintypes.BOOL
+
+    return send_message_timeout, post_message
+
+
+# 모듈 로드 시 한 번만 바인딩 (Windows 이외 환경에서는 None)
+try:
+    _SendMessageTimeoutW, _PostMessageW = _bind_user32()
+except (OSError, AttributeError):
+    _SendMessageTimeoutW = _PostMessageW = None
+
 
 class BroadcastManager:
     """Manages Windows environment change notifications"""
 
+    __slots__ = (
+        '_hwnd_broadcast', '_wm_settingchange', '_smto_abortifhung', '_smto_block',
+        'send_message_timeout', 'post_message',
+        '_env_lparam', '_lparam_cache',
+        '_pending', '_timer', '_lock', '_atexit_registered'
+    )
+
     def __init__(self):
         """Initialize BroadcastManager with Windows API constants"""
         self._hwnd_broadcast = HWND_BROADCAST
         self._wm_settingchange = WM_SETTINGCHANGE
         self._smto_abortifhung = SMTO_ABORTIFHUNG
         self._smto_block = SMTO_BLOCK
-        self._setup_windows_api()
 
-    def _setup_windows_api(self):
-        """Setup Windows API function signatures"""
-        try:
-            # SendMessageTimeoutW 함수 설정
-            self.send_message_timeout = ctypes.windll.user32.SendMessageTimeoutW
-            self.send_message_timeout.argtypes = [
-                wintypes.HWND,      # hWnd
-                wintypes.UINT,      # Msg
-                wintypes.WPARAM,    # wParam
-                wintypes.LPVOID,    # lParam
-                wintypes.UINT,      # fuFlags
-                wintypes.UINT,      # uTimeout
-                ctypes.POINTER(wintypes.DWORD)  # lpdwResult
-            ]
-            self.send_message_timeout.restype = wintypes.LPARAM
-
-            # PostMessageW 함수 설정
-            self.post_message = ctypes.windll.user32.PostMessageW
-            self.post_message.argtypes = [
-                wintypes.HWND,      # hWnd
-                wintypes.UINT,      # Msg
-                wintypes.WPARAM,    # wParam
-                wintypes.LPARAM     # lParam
-            ]
-            self.post_message.restype = wintypes.BOOL
+        # lParam 문자열은 한 번만 UTF-16 버퍼로 변환해 재사용
+        self._env_lparam = ctypes.c_wchar_p('Environment')
+        self._lparam_cache = {'Environment': self._env_lparam}
 
-        except Exception as e:
-            print(f"Windows API 설정 실패: {e}")
-            raise
+        # 디바운스 브로드캐스트 상태
+        self._pending = False
+        self._timer = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+
+        if _SendMessageTimeoutW is None:
+            print("Windows API 설정 실패: user32를 사용할 수 없습니다")
+            raise OSError("user32 is not available on this platform")
+        self.send_message_timeout = _SendMessageTimeoutW
+        self.post_message = _PostMessageW
 
     def broadcast_environment_change(self, timeout: int = 5000) -> bool:
         """
@@ -75,7 +112,7 @@ class BroadcastManager:
                 self._hwnd_broadcast,
                 self._wm_settingchange,
                 0,
-                'Environment',
+                self._env_lparam,
                 self._smto_abortifhung,
                 timeout,
                 ctypes.byref(result)
@@ -103,19 +140,25 @@ class BroadcastManager:
         Returns:
             bool: Success status
         """
+        # 재시도 루프에서 반복되는 속성 조회를 줄이기 위해 지역 변수로 캐시
+        hwnd = self._hwnd_broadcast
+        msg = self._wm_settingchange
+        byref = ctypes.byref
+        send_message_timeout = self.send_message_timeout
+
         try:
             result = wintypes.DWORD()
 
             # Method 1: Send with BLOCK flag to ensure processing
             # 블로킹 플래그를 사용하여 메시지가 처리될 때까지 대기
-            return_value = self.send_message_timeout(
-                self._hwnd_broadcast,
-                self._wm_settingchange,
+            return_value = send_message_timeout(
+                hwnd,
+                msg,
                 0,
-                'Environment',
+                self._env_lparam,
                 self._smto_block | self._smto_abortifhung,
                 timeout,
-                ctypes.byref(result)
+                byref(result)
             )
 
             if not return_value:
@@ -124,8 +167,8 @@ class BroadcastManager:
             # Method 2: Also notify using PostMessage for non-blocking notification
             # 논블로킹 방식으로 추가 알림 전송 (백그라운드 처리)
             post_result = self.post_message(
-                self._hwnd_broadcast,
-                self._wm_settingchange,
+                hwnd,
+                msg,
                 0,
                 0
             )
@@ -158,12 +201,16 @@ class BroadcastManager:
         try:
             result = wintypes.DWORD()
 
+            lparam = self._lparam_cache.get(change_type)
+            if lparam is None:
+                lparam = self._lparam_cache[change_type] = ctypes.c_wchar_p(change_type)
+
             # WM_SETTINGCHANGE 메시지 전송
             return_value = self.send_message_timeout(
                 self._hwnd_broadcast,
                 self._wm_settingchange,
                 0,
-                change_type,
+                lparam,
                 self._smto_abortifhung,
                 timeout,
                 ctypes.byref(result)
@@ -180,6 +227,49 @@ class BroadcastManager:
             print(f"시스템 변경 알림 오류: {e}")
             return False
 
+    def request_broadcast(self, delay: float = BROADCAST_DEBOUNCE_SECONDS) -> None:
+        """
+        Schedule a debounced environment change broadcast
+        Repeated requests within the delay collapse into a single broadcast;
+        a broadcast still pending at interpreter exit is flushed by atexit
+
+        Args:
+            delay: Seconds to wait for further requests before broadcasting
+        """
+        with self._lock:
+            if not self._atexit_registered:
+                # 타이머는 데몬 스레드이므로 종료 직전 대기 중인 브로드캐스트를 보장
+                atexit.register(self.flush_broadcast)
+                self._atexit_registered = True
+            self._pending = True
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(delay, self._do_broadcast)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush_broadcast(self) -> bool:
+        """
+        Immediately send any pending debounced broadcast
+
+        Returns:
+            bool: Broadcast result, or True if nothing was pending
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        return self._do_broadcast()
+
+    def _do_broadcast(self) -> bool:
+        """Send the pending broadcast, if any"""
+        with self._lock:
+            if not self._pending:
+                return True
+            self._pending = False
+            self._timer = None
+        return self.broadcast_environment_change_enhanced()
+
     def broadcast_with_retry(self, max_retries: int = 3, timeout: int = 5000) -> bool:
         """
         Broadcast with retry logic
@@ -191,9 +281,10 @@ class BroadcastManager:
         Returns:
             bool: Success status
         """
+        broadcast = self.broadcast_environment_change_enhanced
         for attempt in range(max_retries):
             try:
-                if self.broadcast_environment_change_enhanced(timeout):
+                if broadcast(timeout):
                     if attempt > 0:
                         print(f"브로드캐스트 성공 (재시도 {attempt}회 후)")
                     return True
@@ -208,4 +299,5 @@ class BroadcastManager:
         return False
 
 
-__all__ = ['BroadcastManager', 'HWND_BROADCAST', 'WM_SETTINGCHANGE', 'SMTO_ABORTIFHUNG', 'SMTO_BLOCK']
+__all__ = ['BroadcastManager', 'HWND_BROADCAST', 'WM_SETTINGCHANGE', 'SMTO_ABORTIFHUNG', 'SMTO_BLOCK',
+           'QUICK_BROADCAST_TIMEOUT_MS']
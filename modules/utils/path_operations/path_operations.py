@@ -5,13 +5,17 @@ Brain Module System v4.0
 """
 
 import os
-import time
+import shutil
 import subprocess
+import traceback
 import winreg
 import ctypes
-from typing import List, Optional, Dict
+from ctypes import wintypes
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Optional, Dict, FrozenSet, Tuple
 from .registry_operations import RegistryOperations
-from .broadcast_manager import BroadcastManager
+from .broadcast_manager import BroadcastManager, QUICK_BROADCAST_TIMEOUT_MS
 from .powershell_integration import PowerShellIntegration
 
 # Import Config for production mode detection with safe initialization
@@ -22,6 +26,68 @@ except Exception:
     # Fallback if Config is not available or initialization fails
     _config = None
 
+# Production mode is fixed after Config init, so resolve subprocess flags once
+_SUBPROCESS_FLAGS = _config.get_subprocess_flags() if _config else 0
+
+
+def _bind_search_path():
+    """Load kernel32 once and configure the SearchPathW prototype"""
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    search_path = kernel32.SearchPathW
+    search_path.argtypes = [
+        wintypes.LPCWSTR,   # lpPath
+        wintypes.LPCWSTR,   # lpFileName
+        wintypes.LPCWSTR,   # lpExtension
+        wintypes.DWORD,     # nBufferLength
+        wintypes.LPWSTR,    # lpBuffer
+        ctypes.POINTER(wintypes.LPWSTR)  # lpFilePart
+    ]
+    search_path.restype = wintypes.DWORD
+    return search_path
+
+
+try:
+    _SearchPathW = _bind_search_path()
+except (OSError, AttributeError):
+    _SearchPathW = None
+
+
+def _parse_path(value: str) -> Tuple[List[str], set]:
+    """Split a registry PATH value into stripped entries and their lowercase set"""
+    paths, paths_lower = [], set()
+    for part in value.split(';'):
+        path = part.strip()
+        if path:
+            paths.append(path)
+            paths_lower.add(path.lower())
+    return paths, paths_lower
+
+
+class _PathCache:
+    """
+    Versioned in-process cache of registry PATH reads
+    Entries are (version, paths, lowercase set); bumping the version invalidates all
+    """
+    _version = 0
+    _entries: Dict[str, Tuple[int, Tuple[str, ...], FrozenSet[str]]] = {}
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._version += 1
+
+    @classmethod
+    def store(cls, hive: str, paths: List[str]) -> Tuple[int, Tuple[str, ...], FrozenSet[str]]:
+        entry = (cls._version, tuple(paths), frozenset(p.lower() for p in paths))
+        cls._entries[hive] = entry
+        return entry
+
+    @classmethod
+    def lookup(cls, hive: str) -> Optional[Tuple[int, Tuple[str, ...], FrozenSet[str]]]:
+        entry = cls._entries.get(hive)
+        if entry is not None and entry[0] == cls._version:
+            return entry
+        return None
+
 
 class PathOperations:
     """High-level PATH management combining all components"""
@@ -32,72 +98,192 @@ class PathOperations:
         self.broadcast_mgr = BroadcastManager()
         self.powershell = PowerShellIntegration()
 
-    def add_to_system_path(self, path: str) -> bool:
-        """
-        Add path to system PATH (basic mode)
+        # Pending additions while inside batch_path_updates() (None = not batching)
+        self._pending_system = None
+        self._pending_user = None
 
-        Args:
-            path: Path to add to system PATH
+        # Deferred WM_SETTINGCHANGE broadcast state
+        self._broadcast_pending = False
+        self._broadcast_enhanced = False
+        self._defer_broadcast = False
 
-        Returns:
-            bool: True if successful, False otherwise
+        # Long-lived HKCU\Environment handle (opened on first use)
+        self._user_env_key = None
+
+    def __del__(self):
+        self._close_keys()
+
+    def _get_user_env_key(self):
+        """Return the cached HKCU\Environment key handle, opening it on first use"""
+        if self._user_env_key is None:
+            self._user_env_key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                r'Environment',
+                0,
+                winreg.KEY_READ | winreg.KEY_WRITE | winreg.KEY_WOW64_64KEY
+            )
+        return self._user_env_key
+
+    def _close_keys(self) -> None:
+        """Close cached registry handles"""
+        key = getattr(self, '_user_env_key', None)
+        if key is not None:
+            self._user_env_key = None
+            try:
+                winreg.CloseKey(key)
+            except OSError:
+                pass
+
+    @contextmanager
+    def batch_path_updates(self):
         """
-        try:
-            # Read current system PATH
-            path_list = self.registry_ops.read_system_path()
+        Defer PATH additions made inside the block to a single update on exit
 
-            # Check if path already exists
-            if path in path_list:
-                print(f"{path}는 이미 시스템 PATH에 있습니다")
-                return True
+        System and User PATH additions are collected and applied with one
+        read-modify-write per hive and one final broadcast.
+        Nested blocks join the outermost batch.
+        """
+        if self._pending_system is not None:
+            yield self
+            return
 
-            # Add the new path
-            path_list.append(path)
+        self._pending_system = []
+        self._pending_user = []
+        self._defer_broadcast = True
+        try:
+            try:
+                yield self
+            finally:
+                system_paths, user_paths = self._pending_system, self._pending_user
+                self._pending_system = None
+                self._pending_user = None
+
+            if system_paths:
+                self.add_multiple_paths_to_system_path(system_paths)
+            if user_paths:
+                self.add_to_user_path_immediate(user_paths)
+        finally:
+            self._defer_broadcast = False
 
-            # Write back to registry
-            if not self.registry_ops.write_system_path(path_list):
-                return False
+        if self._broadcast_pending:
+            self._request_broadcast(enhanced=True)
+        self._flush_broadcast()
 
-            # Broadcast environment change
-            self.broadcast_mgr.broadcast_environment_change()
+    def _request_broadcast(self, enhanced: bool = False) -> None:
+        """Mark that an environment change broadcast is needed"""
+        self._broadcast_pending = True
+        self._broadcast_enhanced = self._broadcast_enhanced or enhanced
 
-            print(f"시스템 PATH에 {path}를 성공적으로 추가했습니다")
+    def _flush_broadcast(self) -> bool:
+        """
+        Send the pending broadcast, unless deferred by batch_path_updates()
+        Enhanced (blocking) broadcast is used only when propagation is verified
+        afterwards; otherwise a single SendMessageTimeout with a short per-window
+        timeout is sent (WM_SETTINGCHANGE carries a string pointer, so the
+        asynchronous SendNotifyMessage/PostMessage paths cannot deliver it)
+        """
+        if not self._broadcast_pending or self._defer_broadcast:
             return True
 
-        except Exception as e:
-            print(f"시스템 PATH 추가 실패: {e}")
-            return False
+        enhanced = self._broadcast_enhanced
+        self._broadcast_pending = False
+        self._broadcast_enhanced = False
+
+        if enhanced:
+            return self.broadcast_mgr.broadcast_environment_change_enhanced()
+        return self.broadcast_mgr.broadcast_environment_change(QUICK_BROADCAST_TIMEOUT_MS)
+
+    def _read_system_path(self) -> List[str]:
+        """Read system PATH from the registry and refresh the cache"""
+        path_list = self.registry_ops.read_system_path(refresh=True)
+        _PathCache.store('system', path_list)
+        return path_list
+
+    def _read_user_path(self) -> List[str]:
+        """Read user PATH from the registry and refresh the cache"""
+        path_list = self.registry_ops.read_user_path(refresh=True)
+        _PathCache.store('user', path_list)
+        return path_list
+
+    def _write_system_path(self, path_list: List[str]) -> bool:
+        """Write system PATH to the registry, invalidate cached reads and seed the new value"""
+        written = self.registry_ops.write_system_path(path_list)
+        _PathCache.invalidate()
+        if written:
+            _PathCache.store('system', path_list)
+        return written
+
+    def _cached_read_system(self) -> Tuple[List[str], FrozenSet[str]]:
+        """System PATH and its lowercase set, served from cache when still valid"""
+        entry = _PathCache.lookup('system')
+        if entry is None:
+            entry = _PathCache.store('system', self.registry_ops.read_system_path())
+        return list(entry[1]), entry[2]
+
+    def _cached_read_user(self) -> Tuple[List[str], FrozenSet[str]]:
+        """User PATH and its lowercase set, served from cache when still valid"""
+        entry = _PathCache.lookup('user')
+        if entry is None:
+            entry = _PathCache.store('user', self.registry_ops.read_user_path())
+        return list(entry[1]), entry[2]
 
-    def add_multiple_paths_to_system_path(self, new_paths: List[str]) -> bool:
+    def add_to_system_path(self, path: str) -> bool:
+        """
+        Add path to system PATH (basic mode)
+
+        Args:
+            path: Path to add to system PATH
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.add_multiple_paths_to_system_path([path])
+
+    def add_multiple_paths_to_system_path(self, new_paths: List[str], final: bool = True) -> bool:
         """
         Add multiple directories to the system PATH environment variable
 
         Args:
             new_paths: List of paths to add to system PATH
+            final: If False, defer the broadcast to the next final update (no message sent now)
 
         Returns:
             bool: True if successful, False otherwise
         """
+        if self._pending_system is not None:
+            self._pending_system.extend(new_paths)
+            return True
+
         try:
-            # Read current system PATH
-            path_list = self.registry_ops.read_system_path()
+            # Read current system PATH fresh (installers may have rewritten it since the last
+            # read); when every path is already present nothing is written or broadcast
+            path_list = self._read_system_path()
+
+            existing_lower = {p.lower() for p in path_list}
 
             added_paths = []
+            messages = []
             for new_path in new_paths:
-                if new_path not in path_list:
+                new_path_lower = new_path.lower()
+                if new_path_lower not in existing_lower:
                     path_list.append(new_path)
+                    existing_lower.add(new_path_lower)
                     added_paths.append(new_path)
-                    print(f"시스템 PATH에 {new_path} 추가하는 중")
+                    messages.append(f"시스템 PATH에 {new_path} 추가하는 중")
                 else:
-                    print(f"{new_path}는 이미 시스템 PATH에 있습니다")
+                    messages.append(f"{new_path}는 이미 시스템 PATH에 있습니다")
+            if messages:
+                print("\n".join(messages))
 
             if added_paths:
                 # Write back to registry
-                if not self.registry_ops.write_system_path(path_list):
+                if not self._write_system_path(path_list):
                     return False
 
-                # Broadcast environment change
-                self.broadcast_mgr.broadcast_environment_change()
+                # Broadcast environment change (non-final: left pending for the caller's final call)
+                self._request_broadcast()
+                if final:
+                    self._flush_broadcast()
 
                 print(f"시스템 PATH에 {len(added_paths)}개의 경로를 성공적으로 추가했습니다")
                 return True
@@ -130,20 +316,22 @@ class PathOperations:
         # First, ensure PowerShell execution policy is set correctly
         self.powershell.ensure_execution_policy()
 
-        # Try PowerShell method first (most reliable)
-        success = self.powershell.update_path_environment(paths)
+        # Direct registry write + WM_SETTINGCHANGE broadcast (no PowerShell process)
+        success = self._update_path_with_immediate_effect(paths)
 
         if not success:
-            # Fallback to enhanced registry method
-            success = self._update_path_with_immediate_effect(paths)
+            # Fallback to PowerShell method
+            success = self.powershell.update_path_environment(paths)
+            _PathCache.invalidate()
+            self.registry_ops.invalidate()
 
-        # Always refresh current process
-        self._refresh_current_process_path()
+        # Always refresh current process. The system hive was just written (cache seeded,
+        # or invalidated by the fallback); the user hive is re-read because other
+        # programs (e.g. the Node MSI adding %APPDATA%\npm) may have changed it
+        self._refresh_current_process_path(system=False)
 
         # Verify propagation
         if success:
-            time.sleep(2)  # Give system time to propagate
-
             # Test with a simple command
             test_result = self._verify_path_propagation('where')
             if test_result:
@@ -165,7 +353,7 @@ class PathOperations:
         """
         try:
             # Read current system PATH
-            path_list = self.registry_ops.read_system_path()
+            path_list = self._read_system_path()
 
             # Check if path exists
             if path not in path_list:
@@ -176,11 +364,12 @@ class PathOperations:
             path_list.remove(path)
 
             # Write back to registry
-            if not self.registry_ops.write_system_path(path_list):
+            if not self._write_system_path(path_list):
                 return False
 
             # Broadcast environment change
-            self.broadcast_mgr.broadcast_environment_change()
+            self._request_broadcast()
+            self._flush_broadcast()
 
             print(f"시스템 PATH에서 {path}를 성공적으로 제거했습니다")
             return True
@@ -196,7 +385,7 @@ class PathOperations:
         Returns:
             List[str]: List of paths in system PATH
         """
-        return self.registry_ops.read_system_path()
+        return self._read_system_path()
 
     def check_path_in_environment(self, target_path: str, case_sensitive: bool = False) -> Dict:
         """
@@ -209,44 +398,67 @@ class PathOperations:
         Returns:
             Dictionary with 'in_system_path', 'in_user_path', 'in_current_path'
         """
-        system_paths = self.registry_ops.read_system_path()
-        user_paths = self.registry_ops.read_user_path()
-        current_path = os.environ.get('PATH', '').split(';')
-
-        if not case_sensitive:
-            target_path = target_path.lower()
-            system_paths = [p.lower() for p in system_paths]
-            user_paths = [p.lower() for p in user_paths]
-            current_path = [p.lower() for p in current_path]
-
-        return {
-            'in_system_path': target_path in system_paths,
-            'in_user_path': target_path in user_paths,
-            'in_current_path': target_path in current_path
-        }
-
-    def refresh_environment_variables(self) -> bool:
+        return self.check_paths_in_environment([target_path], case_sensitive)[target_path]
+
+    def check_paths_in_environment(self, targets: List[str], case_sensitive: bool = False) -> Dict[str, Dict]:
+        """
+        Check several paths against the environment PATH with a single read
+
+        Args:
+            targets: Paths to check
+            case_sensitive: Whether to perform case-sensitive comparison
+
+        Returns:
+            Dictionary mapping each target to its check_path_in_environment() result
+        """
+        # Always read the registry fresh: this is used to verify after installers
+        # (which write PATH outside this process and bypass the PATH cache) have run
+        system_paths = self._read_system_path()
+        user_paths = self._read_user_path()
+        current_path = os.environ.get('PATH', '').split(os.pathsep)
+
+        if case_sensitive:
+            system_set = set(system_paths)
+            user_set = set(user_paths)
+            current_set = set(current_path)
+        else:
+            system_set = {p.lower() for p in system_paths}
+            user_set = {p.lower() for p in user_paths}
+            current_set = {p.lower() for p in current_path}
+
+        results = {}
+        for target in targets:
+            key = target if case_sensitive else target.lower()
+            results[target] = {
+                'in_system_path': key in system_set,
+                'in_user_path': key in user_set,
+                'in_current_path': key in current_set
+            }
+        return results
+
+    def refresh_environment_variables(self, system: bool = True, user: bool = True) -> bool:
         """
         Refresh environment variables for the current process
 
+        Args:
+            system: Re-read system PATH from the registry (otherwise use cached value)
+            user: Re-read user PATH from the registry (otherwise use cached value)
+
         Returns:
             bool: True if successful, False otherwise
         """
         try:
             # Refresh PATH from registry
-            system_path = self.registry_ops.read_system_path()
-            user_path = self.registry_ops.read_user_path()
+            system_path = self._read_system_path() if system else self._cached_read_system()[0]
+            user_path = self._read_user_path() if user else self._cached_read_user()[0]
 
             # Combine paths
-            combined_path = []
-            if system_path:
-                combined_path.extend(system_path)
-            if user_path:
-                combined_path.extend(user_path)
+            combined_path = list(system_path or ())
+            combined_path.extend(user_path or ())
 
             # Update current process PATH
             if combined_path:
-                os.environ['PATH'] = ';'.join(combined_path)
+                os.environ['PATH'] = os.pathsep.join(combined_path)
 
             return True
         except Exception as e:
@@ -267,25 +479,29 @@ class PathOperations:
         """
         try:
             # Read current system PATH
-            path_list = self.registry_ops.read_system_path()
+            path_list = self._read_system_path()
 
-            added = False
+            existing_lower = {p.lower() for p in path_list}
+
+            messages = []
             for new_path in new_paths:
-                if new_path not in path_list:
+                new_path_lower = new_path.lower()
+                if new_path_lower not in existing_lower:
                     path_list.append(new_path)
-                    added = True
-                    print(f"PATH에 추가하는 중: {new_path}")
+                    existing_lower.add(new_path_lower)
+                    messages.append(f"PATH에 추가하는 중: {new_path}")
+            added = bool(messages)
+            if added:
+                print("\n".join(messages))
 
             if added:
                 # Write back to registry
-                if not self.registry_ops.write_system_path(path_list):
+                if not self._write_system_path(path_list):
                     return False
 
-                # Force Explorer to reload
-                self._force_refresh_explorer_environment()
-
-                # Enhanced broadcast
-                self.broadcast_mgr.broadcast_environment_change_enhanced()
+                # Enhanced broadcast (forces Explorer to reload)
+                self._request_broadcast(enhanced=True)
+                self._flush_broadcast()
 
                 print("PATH가 즉시 적용되도록 업데이트되었습니다")
                 return True
@@ -303,30 +519,7 @@ class PathOperations:
         This affects all new processes spawned from Explorer
         """
         try:
-            # Method 1: Use setx to trigger system-wide refresh
-            # setx creates a permanent change AND notifies the system
-            dummy_var = f"TEMP_REFRESH_{int(time.time())}"
-            creationflags = _config.get_subprocess_flags() if _config else 0
-            subprocess.run(
-                ['setx', dummy_var, 'refresh'],
-                capture_output=True,
-                shell=True,
-                timeout=5,
-                creationflags=creationflags
-            )
-
-            # Clean up the dummy variable
-            subprocess.run(
-                ['reg', 'delete',
-                 'HKCU\\Environment',
-                 '/v', dummy_var, '/f'],
-                capture_output=True,
-                shell=True,
-                timeout=5,
-                creationflags=creationflags
-            )
-
-            # Method 2: Broadcast WM_SETTINGCHANGE more aggressively
+            # Broadcast WM_SETTINGCHANGE directly; no dummy variable round-trip needed
             self.broadcast_mgr.broadcast_environment_change_enhanced()
 
             print("탐색기 환경 새로고침이 트리거되었습니다")
@@ -335,21 +528,18 @@ class PathOperations:
             print(f"탐색기 환경 새로고침 실패: {e}")
             return False
 
-    def _refresh_current_process_path(self) -> bool:
+    def _refresh_current_process_path(self, system: bool = True, user: bool = True) -> bool:
         """
         Refresh PATH for the current Python process
+        Hives not flagged for refresh are served from the PATH cache
         """
         try:
-            # Get system PATH from registry
-            system_path = self.registry_ops.read_system_path()
-            user_path = self.registry_ops.read_user_path()
-
-            # Combine and update current process
-            combined = ';'.join(system_path)
-            if user_path:
-                combined = f"{combined};{';'.join(user_path)}"
+            # Get PATH from registry
+            system_path = self._read_system_path() if system else self._cached_read_system()[0]
+            user_path = self._read_user_path() if user else self._cached_read_user()[0]
 
-            os.environ['PATH'] = combined
+            # Combine with a single join and update current process
+            os.environ['PATH'] = os.pathsep.join(filter(None, [*(system_path or ()), *(user_path or ())]))
 
             print("현재 프로세스의 PATH를 새로고침했습니다")
             return True
@@ -358,9 +548,21 @@ class PathOperations:
             print(f"현재 프로세스 PATH 새로고침 실패: {e}")
             return False
 
+    @staticmethod
+    def _command_on_path(command: str) -> bool:
+        """Resolve a command against the current process PATH without spawning a process"""
+        if _SearchPathW is not None:
+            buf = ctypes.create_unicode_buffer(260)
+            return bool(_SearchPathW(None, command, '.exe', 260, buf, None))
+        return shutil.which(command) is not None
+
     def _verify_path_propagation(self, test_command: str = 'git') -> bool:
         """
-        Test if PATH changes have propagated by spawning a test process
+        Test if PATH changes have propagated
+
+        Resolves the command once with SearchPathW against the refreshed PATH of
+        the current process (it cannot change while waiting, so there is no poll).
+        If that fails, a new PowerShell process checks it as a fresh process would.
 
         Args:
             test_command: Command to test
@@ -368,15 +570,19 @@ class PathOperations:
         Returns:
             bool: True if command is accessible in new process
         """
+        if self._command_on_path(test_command):
+            return True
+
         try:
-            # Test in a completely new process
-            creationflags = _config.get_subprocess_flags() if _config else 0
+            # Fallback: test in a completely new process (skip $PROFILE load)
             result = subprocess.run(
-                ['powershell', '-Command', f'(Get-Command {test_command} -ErrorAction SilentlyContinue) -ne $null'],
+                ['powershell', '-NoProfile', '-NonInteractive', '-Command',
+                 f'(Get-Command {test_command} -ErrorAction SilentlyContinue) -ne $null'],
                 capture_output=True,
                 text=True,
                 shell=False,
-                creationflags=creationflags
+                timeout=10,
+                creationflags=_SUBPROCESS_FLAGS
             )
 
             return result.returncode == 0 and 'True' in result.stdout
@@ -404,11 +610,6 @@ class PathOperations:
             - Checks for duplicates (case-insensitive)
             - Broadcasts WM_SETTINGCHANGE for immediate effect
         """
-        # Broadcast constants
-        HWND_BROADCAST = 0xFFFF
-        WM_SETTINGCHANGE = 0x001A
-        SMTO_ABORTIFHUNG = 0x0002
-
         try:
             # Handle input: convert single path to list
             if isinstance(paths, str):
@@ -418,50 +619,55 @@ class PathOperations:
                 print("추가할 경로가 제공되지 않았습니다")
                 return False
 
-            # Open User Environment registry key
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                r'Environment',
-                0,
-                winreg.KEY_READ | winreg.KEY_WRITE
-            )
+            # Defer to the enclosing batch_path_updates() block
+            if self._pending_user is not None:
+                self._pending_user.extend(paths)
+                return True
+
+            # Reuse the cached User Environment registry key
+            key = self._get_user_env_key()
 
             try:
                 # Read current PATH
                 current_path, reg_type = winreg.QueryValueEx(key, 'Path')
 
-                # Parse current PATH into list
-                current_paths = [p.strip() for p in current_path.split(';') if p.strip()]
-
-                # Convert paths for case-insensitive comparison
-                current_paths_lower = [p.lower() for p in current_paths]
+                # Parse current PATH into list and lowercase set in one pass
+                current_paths, current_paths_lower = _parse_path(current_path)
 
                 added_count = 0
                 skipped_count = 0
 
+                appdata_roaming = os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Roaming')
+                appdata_roaming_lower = appdata_roaming.lower()
+                messages = []
+
                 for new_path in paths:
                     # Convert AppData\Roaming to %APPDATA% format
                     new_path = new_path.strip()
-                    appdata_roaming = os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Roaming')
+                    new_path_lower = new_path.lower()
 
-                    if new_path.lower().startswith(appdata_roaming.lower()):
+                    if new_path_lower.startswith(appdata_roaming_lower):
                         # Replace AppData\Roaming with %APPDATA%
                         relative_part = new_path[len(appdata_roaming):].lstrip('\\/')
                         new_path = os.path.join('%APPDATA%', relative_part)
-                        print(f"환경변수 형식으로 변환: {new_path}")
+                        new_path_lower = new_path.lower()
+                        messages.append(f"환경변수 형식으로 변환: {new_path}")
 
                     # Check for duplicates (case-insensitive)
-                    if new_path.lower() in current_paths_lower:
-                        print(f"이미 User PATH에 존재: {new_path}")
+                    if new_path_lower in current_paths_lower:
+                        messages.append(f"이미 User PATH에 존재: {new_path}")
                         skipped_count += 1
                         continue
 
                     # Add new path
                     current_paths.append(new_path)
-                    current_paths_lower.append(new_path.lower())
-                    print(f"User PATH에 추가: {new_path}")
+                    current_paths_lower.add(new_path_lower)
+                    messages.append(f"User PATH에 추가: {new_path}")
                     added_count += 1
 
+                if messages:
+                    print("\n".join(messages))
+
                 # Write back to registry if any paths were added
                 if added_count > 0:
                     # Join paths with semicolon
@@ -475,172 +681,47 @@ class PathOperations:
                         winreg.REG_EXPAND_SZ,
                         new_path_value
                     )
+                    _PathCache.invalidate()
+                    self.registry_ops.invalidate()
 
                     print(f"\nUser PATH 레지스트리 업데이트 완료 ({added_count}개 추가)")
 
                     # Broadcast WM_SETTINGCHANGE for immediate effect
-                    result = ctypes.c_long()
-                    ctypes.windll.user32.SendMessageTimeoutW(
-                        HWND_BROADCAST,
-                        WM_SETTINGCHANGE,
-                        0,
-                        'Environment',
-                        SMTO_ABORTIFHUNG,
-                        5000,
-                        ctypes.byref(result)
-                    )
+                    self._request_broadcast()
+                    self._flush_broadcast()
 
-                    print("WM_SETTINGCHANGE 브로드캐스트 완료")
-                    print("\n[안내] 변경사항은 새로운 프로세스에 즉시 적용됩니다.")
-                    print("[안내] VSCode에서 변경사항을 확인하려면 VSCode를 재시작하세요.")
+                    print("WM_SETTINGCHANGE 브로드캐스트 완료\n"
+                          "\n[안내] 변경사항은 새로운 프로세스에 즉시 적용됩니다.\n"
+                          "[안내] VSCode에서 변경사항을 확인하려면 VSCode를 재시작하세요.")
 
                 else:
                     print(f"\n모든 경로가 이미 User PATH에 존재합니다 (건너뜀: {skipped_count}개)")
 
-            finally:
-                winreg.CloseKey(key)
+            except OSError:
+                # Handle may have gone stale; reopen on next call
+                self._close_keys()
+                raise
 
             return True
 
         except PermissionError:
-            print("\n[오류] User PATH 수정 권한이 없습니다")
-            print("       일반적으로 User PATH는 관리자 권한 없이 수정 가능합니다")
+            print("\n[오류] User PATH 수정 권한이 없습니다\n"
+                  "       일반적으로 User PATH는 관리자 권한 없이 수정 가능합니다")
             return False
 
         except Exception as e:
             print(f"\n[오류] User PATH 추가 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            if _config is not None and not _config.is_production_mode():
+                traceback.print_exc()
             return False
 
 
-def add_to_user_path_immediate(paths) -> bool:
-    """
-    Add paths to User PATH with immediate effect
+@lru_cache(maxsize=None)
+def _default_ops() -> PathOperations:
+    """Shared PathOperations instance for module-level helpers"""
+    return PathOperations()
 
-    This function modifies HKEY_CURRENT_USER\\Environment registry
-    and broadcasts WM_SETTINGCHANGE to apply changes immediately.
-
-    Args:
-        paths: Single path string or list of paths to add
-
-    Returns:
-        bool: True if successful, False otherwise
-
-    Features:
-        - Supports environment variable expansion (%APPDATA%, etc.)
-        - Converts AppData\\Roaming paths to %APPDATA% format
-        - Checks for duplicates (case-insensitive)
-        - Broadcasts WM_SETTINGCHANGE for immediate effect
-    """
-    # Broadcast constants
-    HWND_BROADCAST = 0xFFFF
-    WM_SETTINGCHANGE = 0x001A
-    SMTO_ABORTIFHUNG = 0x0002
 
-    try:
-        # Handle input: convert single path to list
-        if isinstance(paths, str):
-            paths = [paths]
-
-        if not paths:
-            print("추가할 경로가 제공되지 않았습니다")
-            return False
-
-        # Open User Environment registry key
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            r'Environment',
-            0,
-            winreg.KEY_READ | winreg.KEY_WRITE
-        )
-
-        try:
-            # Read current PATH
-            current_path, reg_type = winreg.QueryValueEx(key, 'Path')
-
-            # Parse current PATH into list
-            current_paths = [p.strip() for p in current_path.split(';') if p.strip()]
-
-            # Convert paths for case-insensitive comparison
-            current_paths_lower = [p.lower() for p in current_paths]
-
-            added_count = 0
-            skipped_count = 0
-
-            for new_path in paths:
-                # Convert AppData\Roaming to %APPDATA% format
-                new_path = new_path.strip()
-                appdata_roaming = os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Roaming')
-
-                if new_path.lower().startswith(appdata_roaming.lower()):
-                    # Replace AppData\Roaming with %APPDATA%
-                    relative_part = new_path[len(appdata_roaming):].lstrip('\\/')
-                    new_path = os.path.join('%APPDATA%', relative_part)
-                    print(f"환경변수 형식으로 변환: {new_path}")
-
-                # Check for duplicates (case-insensitive)
-                if new_path.lower() in current_paths_lower:
-                    print(f"이미 User PATH에 존재: {new_path}")
-                    skipped_count += 1
-                    continue
-
-                # Add new path
-                current_paths.append(new_path)
-                current_paths_lower.append(new_path.lower())
-                print(f"User PATH에 추가: {new_path}")
-                added_count += 1
-
-            # Write back to registry if any paths were added
-            if added_count > 0:
-                # Join paths with semicolon
-                new_path_value = ';'.join(current_paths)
-
-                # Use REG_EXPAND_SZ to support environment variable expansion
-                winreg.SetValueEx(
-                    key,
-                    'Path',
-                    0,
-                    winreg.REG_EXPAND_SZ,
-                    new_path_value
-                )
-
-                print(f"\nUser PATH 레지스트리 업데이트 완료 ({added_count}개 추가)")
-
-                # Broadcast WM_SETTINGCHANGE for immediate effect
-                result = ctypes.c_long()
-                ctypes.windll.user32.SendMessageTimeoutW(
-                    HWND_BROADCAST,
-                    WM_SETTINGCHANGE,
-                    0,
-                    'Environment',
-                    SMTO_ABORTIFHUNG,
-                    5000,
-                    ctypes.byref(result)
-                )
-
-                print("WM_SETTINGCHANGE 브로드캐스트 완료")
-                print("\n[안내] 변경사항은 새로운 프로세스에 즉시 적용됩니다.")
-                print("[안내] VSCode에서 변경사항을 확인하려면 VSCode를 재시작하세요.")
-
-            else:
-                print(f"\n모든 경로가 이미 User PATH에 존재합니다 (건너뜀: {skipped_count}개)")
-
-        finally:
-            winreg.CloseKey(key)
-
-        return True
-
-    except PermissionError:
-        print("\n[오류] User PATH 수정 권한이 없습니다")
-        print("       일반적으로 User PATH는 관리자 권한 없이 수정 가능합니다")
-        return False
-
-    except Exception as e:
-        print(f"\n[오류] User PATH 추가 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-__all__ = ['PathOperations']
+def add_to_user_path_immediate(paths) -> bool:
+    """Add paths to User PATH with immediate effect (see PathOperations.add_to_user_path_immediate)"""
+    return _default_ops().add_to_user_path_immediate(paths)
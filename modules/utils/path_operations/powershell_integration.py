@@ -4,8 +4,17 @@ PowerShell script execution for PATH management
 Brain Module System v4.0
 """
 
+import base64
+import collections
+import locale
+import os
+import queue
 import subprocess
-from typing import Optional, Tuple, List
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Optional, Tuple, List
 
 # Import Config for production mode detection with safe initialization
 try:
@@ -15,17 +24,206 @@ except Exception:
     # Fallback if Config is not available or initialization fails
     _config = None
 
+# Production mode is fixed after Config init, so resolve subprocess flags once
+_SUBPROCESS_FLAGS = _config.get_subprocess_flags() if _config else 0
+
+# Upper bound on output lines kept per execute_script call (oldest lines are dropped)
+_MAX_OUTPUT_LINES = 10_000
+
+# Buffered log messages are flushed once this many are pending
+_LOG_FLUSH_THRESHOLD = 16
+
+
+# Helper functions defined once per PowerShell host; later calls invoke them by name
+_HOST_FUNCTIONS = """
+function global:Verify-Paths([string[]]$Paths) {
+    $currentPath = [Environment]::GetEnvironmentVariable('PATH', 'Machine')
+
+    # Case-insensitive set, trailing backslashes normalized
+    $pathSet = [System.Collections.Generic.HashSet[string]]::new([StringComparer]::OrdinalIgnoreCase)
+    foreach ($p in ($currentPath -split ';')) { if ($p -ne '') { [void]$pathSet.Add($p.TrimEnd('\\')) } }
+
+    $allFound = $true
+    foreach ($pathToCheck in $Paths) {
+        if (-not $pathSet.Contains($pathToCheck.TrimEnd('\\'))) {
+            Write-Host "누락: $pathToCheck"
+            $allFound = $false
+        } else {
+            Write-Host "확인: $pathToCheck"
+        }
+    }
+
+    if ($allFound) {
+        Write-Host "모든 경로가 PATH에 있습니다"
+    } else {
+        Write-Host "일부 경로가 PATH에 없습니다"
+        $global:LASTEXITCODE = 1
+    }
+}
+
+function global:Update-Path([string[]]$Paths) {
+    $currentPath = [Environment]::GetEnvironmentVariable('PATH', 'Machine')
+    $pathList = [System.Collections.Generic.List[string]]::new()
+    $pathSet = [System.Collections.Generic.HashSet[string]]::new([StringComparer]::OrdinalIgnoreCase)
+    foreach ($p in ($currentPath -split ';')) {
+        if ($p -ne '') {
+            $pathList.Add($p)
+            [void]$pathSet.Add($p)
+        }
+    }
+
+    foreach ($newPath in $Paths) {
+        if ($pathSet.Add($newPath)) {
+            $pathList.Add($newPath)
+            Write-Host "추가하는 중: $newPath"
+        }
+    }
+
+    # This method triggers immediate propagation
+    [Environment]::SetEnvironmentVariable('PATH', ($pathList -join ';'), 'Machine')
+
+    Write-Host "PATH가 성공적으로 업데이트되었습니다"
+}
+"""
+
+
+def _unique_paths(paths: List[str]) -> List[str]:
+    """Drop duplicates (case/separator/trailing-backslash insensitive), keeping first spelling"""
+    unique = {}
+    for path in paths:
+        unique.setdefault(os.path.normcase(os.path.normpath(path)).rstrip('\\'), path)
+    return list(unique.values())
+
+
+def _ps_array(paths: List[str]) -> str:
+    """Render paths as a PowerShell array literal of single-quoted strings"""
+    return "@(" + ",".join("'" + p.replace("'", "''") + "'" for p in paths) + ")"
+
+
+def _ps_argv(script: str, bypass: bool = False) -> List[str]:
+    """
+    Build a powershell.exe command line that skips $PROFILE and interactive prompts
+
+    Args:
+        script: Command text for -Command ('-' reads from stdin)
+        bypass: Add '-ExecutionPolicy Bypass' (must stay off when reading or
+                setting the execution policy, since it overrides the Process scope)
+    """
+    argv = ['powershell', '-NoProfile', '-NonInteractive']
+    if bypass:
+        argv += ['-ExecutionPolicy', 'Bypass']
+    argv += ['-Command', script]
+    return argv
+
 
 class PowerShellIntegration:
     """Manages PowerShell script execution"""
 
-    def __init__(self):
-        """Initialize PowerShell integration"""
+    def __init__(self, log_callback: Optional[Callable] = None):
+        """
+        Initialize PowerShell integration
+
+        Args:
+            log_callback: Optional callback for log messages (printed if None)
+        """
         self._config = _config
+        self.log_callback = log_callback
+        self._log_buffer: Optional[List[str]] = None  # list while _log_batch() is open
+
+        # (LocalMachine, Effective) execution policies; cleared when a policy is set
+        self._policy_cache: Optional[Tuple[str, str]] = None
+
+        # Long-running PowerShell host for execute_script (started on first use)
+        self._proc: Optional[subprocess.Popen] = None
+        self._output: Optional[queue.Queue] = None
+        self._initialized = False  # _HOST_FUNCTIONS defined in the running host
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        self.close()
+
+    @contextmanager
+    def _log_batch(self):
+        """Buffer log messages for the duration of one operation and write them once"""
+        if self._log_buffer is not None:
+            yield
+            return
+        self._log_buffer = []
+        try:
+            yield
+        finally:
+            self._flush_log()
+            self._log_buffer = None
+
+    def _log(self, message: str) -> None:
+        """Log a message; buffered inside _log_batch()"""
+        if self._log_buffer is None:
+            self._emit(message)
+            return
+        self._log_buffer.append(message)
+        if len(self._log_buffer) >= _LOG_FLUSH_THRESHOLD:
+            self._flush_log()
+
+    def _flush_log(self) -> None:
+        """Write buffered log messages in one call"""
+        if self._log_buffer:
+            self._emit("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def _emit(self, text: str) -> None:
+        if self.log_callback:
+            self.log_callback(text)
+        else:
+            print(text)
+
+    def invalidate_cache(self) -> None:
+        """Forget the cached execution policies"""
+        self._policy_cache = None
+
+    def close(self) -> None:
+        """Terminate the PowerShell host process if running"""
+        proc = getattr(self, '_proc', None)
+        self._proc = None
+        self._output = None
+        self._initialized = False
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=2)
+            except Exception:
+                proc.kill()
+
+    def _start_host(self) -> None:
+        """Start the PowerShell host reading commands from stdin"""
+        proc = subprocess.Popen(
+            _ps_argv('-', bypass=True),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            shell=False,
+            creationflags=_SUBPROCESS_FLAGS
+        )
+        output = queue.Queue()
+
+        def pump():
+            for line in proc.stdout:
+                output.put(line)
+            output.put(None)  # EOF: host exited
+
+        threading.Thread(target=pump, daemon=True).start()
+        self._proc = proc
+        self._output = output
+        self._initialized = False
 
     def execute_script(self, script: str, timeout: int = 30) -> Tuple[bool, str]:
         """
-        Execute PowerShell script
+        Execute PowerShell script in the shared PowerShell host
+
+        The script is sent as a single base64 line followed by a unique sentinel,
+        so the host's startup cost is paid once per process. A script that calls
+        'exit' ends the host; its exit code is used and the host restarts next call.
+        _HOST_FUNCTIONS are defined once before the first script of each host.
 
         Args:
             script: PowerShell script content
@@ -34,26 +232,92 @@ class PowerShellIntegration:
         Returns:
             (success, output)
         """
-        try:
-            creationflags = self._config.get_subprocess_flags() if self._config else 0
-            result = subprocess.run(
-                ['powershell', '-ExecutionPolicy', 'Bypass', '-Command', script],
-                capture_output=True,
-                text=True,
-                shell=False,
-                timeout=timeout,
-                creationflags=creationflags
-            )
+        with self._lock:
+            try:
+                if self._proc is None or self._proc.poll() is not None:
+                    self._start_host()
+
+                if not self._initialized:
+                    ok, output = self._send(_HOST_FUNCTIONS, timeout)
+                    if not ok:
+                        self.close()
+                        return False, output
+                    self._initialized = True
+
+                return self._send(script, timeout)
+
+            except queue.Empty:
+                self.close()
+                return False, f"PowerShell script execution timeout after {timeout} seconds"
+            except Exception as e:
+                self.close()
+                return False, f"PowerShell execution error: {str(e)}"
+
+    def _send(self, script: str, timeout: int) -> Tuple[bool, str]:
+        """
+        Run one script in the running host and collect its output up to the sentinel
 
-            if result.returncode == 0:
-                return True, result.stdout
-            else:
-                return False, result.stderr
+        Raises:
+            queue.Empty: No sentinel within timeout seconds
+        """
+        sentinel = f"###END###{uuid.uuid4().hex}"
+        encoded = base64.b64encode(script.encode('utf-8')).decode('ascii')
+        command = (
+            "$global:LASTEXITCODE = 0; $__ok = $true; "
+            "try { & ([scriptblock]::Create([Text.Encoding]::UTF8.GetString("
+            f"[Convert]::FromBase64String('{encoded}')))) | Out-String -Stream }} "
+            "catch { $__ok = $false; $_ | Out-String -Stream }; "
+            "if ($LASTEXITCODE) { $__ok = $false }; "
+            f"Write-Output \"{sentinel} $__ok\"\n"
+        )
+        self._proc.stdin.write(command)
+        self._proc.stdin.flush()
+
+        lines = collections.deque(maxlen=_MAX_OUTPUT_LINES)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise queue.Empty
+            line = self._output.get(timeout=remaining)
+
+            if line is None:
+                # Host exited (script called 'exit'); use its exit code
+                returncode = self._proc.wait()
+                self._proc = None
+                self._initialized = False
+                return returncode == 0, ''.join(lines)
+
+            if line.startswith(sentinel):
+                return line.rstrip().endswith('True'), ''.join(lines)
+            lines.append(line)
+
+    def _get_execution_policies(self) -> Tuple[str, str]:
+        """
+        Read LocalMachine and effective execution policies in one PowerShell process
+        The result is cached for the lifetime of this instance
 
-        except subprocess.TimeoutExpired:
-            return False, f"PowerShell script execution timeout after {timeout} seconds"
-        except Exception as e:
-            return False, f"PowerShell execution error: {str(e)}"
+        Returns:
+            (localmachine_policy, effective_policy)
+        """
+        if self._policy_cache is not None:
+            return self._policy_cache
+
+        result = subprocess.run(
+            _ps_argv('Write-Output (Get-ExecutionPolicy -Scope LocalMachine); Write-Output (Get-ExecutionPolicy)'),
+            capture_output=True,
+            text=True,
+            shell=False,
+            creationflags=_SUBPROCESS_FLAGS
+        )
+
+        lines = result.stdout.strip().splitlines()
+        localmachine_policy = lines[0].strip() if lines else ''
+        effective_policy = lines[1].strip() if len(lines) > 1 else ''
+
+        if result.returncode == 0 and localmachine_policy and effective_policy:
+            self._policy_cache = (localmachine_policy, effective_policy)
+        return localmachine_policy, effective_policy
 
     def check_execution_policy(self) -> str:
         """
@@ -63,28 +327,7 @@ class PowerShellIntegration:
             str: Execution policy name (LocalMachine, Effective, etc.)
         """
         try:
-            # Check LocalMachine scope first
-            creationflags = self._config.get_subprocess_flags() if self._config else 0
-            result = subprocess.run(
-                ['powershell', '-Command', 'Get-ExecutionPolicy -Scope LocalMachine'],
-                capture_output=True,
-                text=True,
-                shell=False,
-                creationflags=creationflags
-            )
-
-            localmachine_policy = result.stdout.strip()
-
-            # Also check effective policy
-            effective_result = subprocess.run(
-                ['powershell', '-Command', 'Get-ExecutionPolicy'],
-                capture_output=True,
-                text=True,
-                shell=False,
-                creationflags=creationflags
-            )
-
-            effective_policy = effective_result.stdout.strip()
+            localmachine_policy, effective_policy = self._get_execution_policies()
 
             return f"LocalMachine: {localmachine_policy}, Effective: {effective_policy}"
 
@@ -104,28 +347,28 @@ class PowerShellIntegration:
             bool: True if successful
         """
         try:
-            print(f"{scope} 범위에서 PowerShell 실행 정책을 {policy}로 설정하는 중...")
+            self._log(f"{scope} 범위에서 PowerShell 실행 정책을 {policy}로 설정하는 중...")
 
-            creationflags = self._config.get_subprocess_flags() if self._config else 0
             result = subprocess.run(
-                ['powershell', '-Command',
-                 f'Set-ExecutionPolicy -ExecutionPolicy {policy} -Scope {scope} -Force'],
-                capture_output=True,
-                text=True,
+                _ps_argv(f'Set-ExecutionPolicy -ExecutionPolicy {policy} -Scope {scope} -Force'),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 shell=False,
-                creationflags=creationflags
+                creationflags=_SUBPROCESS_FLAGS
             )
 
             if result.returncode == 0:
-                print(f"[OK] PowerShell 실행 정책이 {policy}({scope})로 업데이트되었습니다")
+                self.invalidate_cache()
+                self._log(f"[OK] PowerShell 실행 정책이 {policy}({scope})로 업데이트되었습니다")
                 return True
             else:
-                error_msg = result.stderr.strip()
-                print(f"[경고] {scope} 실행 정책 설정 실패: {error_msg}")
+                # Decode only on failure, with the same codec text=True would use
+                error_msg = result.stderr.decode(locale.getpreferredencoding(False), 'replace').strip()
+                self._log(f"[경고] {scope} 실행 정책 설정 실패: {error_msg}")
                 return False
 
         except Exception as e:
-            print(f"PowerShell 실행 정책 설정 실패: {e}")
+            self._log(f"PowerShell 실행 정책 설정 실패: {e}")
             return False
 
     def ensure_execution_policy(self) -> bool:
@@ -136,59 +379,40 @@ class PowerShellIntegration:
         Returns:
             bool: True if policy is set correctly or was successfully changed
         """
-        try:
-            # Check current execution policy
-            creationflags = self._config.get_subprocess_flags() if self._config else 0
-            result = subprocess.run(
-                ['powershell', '-Command', 'Get-ExecutionPolicy -Scope LocalMachine'],
-                capture_output=True,
-                text=True,
-                shell=False,
-                creationflags=creationflags
-            )
-
-            localmachine_policy = result.stdout.strip()
-            print(f"LocalMachine PowerShell 실행 정책: {localmachine_policy}")
-
-            # Also check effective policy
-            effective_result = subprocess.run(
-                ['powershell', '-Command', 'Get-ExecutionPolicy'],
-                capture_output=True,
-                text=True,
-                shell=False,
-                creationflags=creationflags
-            )
-
-            effective_policy = effective_result.stdout.strip()
-            print(f"유효한 PowerShell 실행 정책: {effective_policy}")
-
-            # If policies are restrictive, fix it
-            if (localmachine_policy in ['Restricted', 'AllSigned', 'Undefined'] or
-                effective_policy in ['Restricted', 'AllSigned']):
-
-                print("LocalMachine 범위에서 PowerShell 실행 정책을 RemoteSigned로 설정하는 중...")
-                print("이는 모든 향후 PowerShell 세션과 IDE에 적용됩니다")
-
-                # Try LocalMachine first
-                if self.set_execution_policy('RemoteSigned', 'LocalMachine'):
-                    print("[OK] 모든 새로운 PowerShell 세션에서 적용됩니다")
-                    return True
-                else:
-                    # Fallback to CurrentUser
-                    print("CurrentUser 범위로 대체하는 중...")
-                    if self.set_execution_policy('RemoteSigned', 'CurrentUser'):
-                        print("[정보] 참고: 현재 사용자에게만 적용됩니다. LocalMachine 범위는 관리자 권한이 필요합니다")
+        with self._log_batch():
+            try:
+                # Check current LocalMachine and effective policies
+                localmachine_policy, effective_policy = self._get_execution_policies()
+                self._log(f"LocalMachine PowerShell 실행 정책: {localmachine_policy}")
+                self._log(f"유효한 PowerShell 실행 정책: {effective_policy}")
+
+                # If policies are restrictive, fix it
+                if (localmachine_policy in ['Restricted', 'AllSigned', 'Undefined'] or
+                    effective_policy in ['Restricted', 'AllSigned']):
+
+                    self._log("LocalMachine 범위에서 PowerShell 실행 정책을 RemoteSigned로 설정하는 중...")
+                    self._log("이는 모든 향후 PowerShell 세션과 IDE에 적용됩니다")
+
+                    # Try LocalMachine first
+                    if self.set_execution_policy('RemoteSigned', 'LocalMachine'):
+                        self._log("[OK] 모든 새로운 PowerShell 세션에서 적용됩니다")
                         return True
                     else:
-                        print("[오류] 모든 범위에서 실행 정책 설정 실패")
-                        return False
-            else:
-                print(f"[OK] PowerShell 실행 정책이 이미 {effective_policy}입니다")
-                return True
+                        # Fallback to CurrentUser
+                        self._log("CurrentUser 범위로 대체하는 중...")
+                        if self.set_execution_policy('RemoteSigned', 'CurrentUser'):
+                            self._log("[정보] 참고: 현재 사용자에게만 적용됩니다. LocalMachine 범위는 관리자 권한이 필요합니다")
+                            return True
+                        else:
+                            self._log("[오류] 모든 범위에서 실행 정책 설정 실패")
+                            return False
+                else:
+                    self._log(f"[OK] PowerShell 실행 정책이 이미 {effective_policy}입니다")
+                    return True
 
-        except Exception as e:
-            print(f"PowerShell 실행 정책 확인/설정 실패: {e}")
-            return False
+            except Exception as e:
+                self._log(f"PowerShell 실행 정책 확인/설정 실패: {e}")
+                return False
 
     def verify_path_changes(self, added_paths: List[str]) -> bool:
         """
@@ -204,41 +428,16 @@ class PowerShellIntegration:
             if not added_paths:
                 return True
 
-            # Build verification script
-            paths_check = ','.join([f"'{p}'" for p in added_paths])
-
-            script = f"""
-            $currentPath = [Environment]::GetEnvironmentVariable('PATH', 'Machine')
-            $pathArray = $currentPath -split ';' | Where-Object {{ $_ -ne '' }}
-
-            $pathsToCheck = @({paths_check})
-            $allFound = $true
-
-            foreach ($pathToCheck in $pathsToCheck) {{
-                if ($pathArray -notcontains $pathToCheck) {{
-                    Write-Host "누락: $pathToCheck"
-                    $allFound = $false
-                }} else {{
-                    Write-Host "확인: $pathToCheck"
-                }}
-            }}
-
-            if ($allFound) {{
-                Write-Host "모든 경로가 PATH에 있습니다"
-                exit 0
-            }} else {{
-                Write-Host "일부 경로가 PATH에 없습니다"
-                exit 1
-            }}
-            """
+            # Verify-Paths is defined once per host (see _HOST_FUNCTIONS)
+            script = f"Verify-Paths {_ps_array(_unique_paths(added_paths))}"
 
             success, output = self.execute_script(script)
-            print(output)
+            self._log(output)
 
             return success
 
         except Exception as e:
-            print(f"PATH 검증 실패: {e}")
+            self._log(f"PATH 검증 실패: {e}")
             return False
 
     def update_path_environment(self, paths_to_add: List[str]) -> bool:
@@ -253,42 +452,21 @@ class PowerShellIntegration:
             bool: True if successful
         """
         try:
-            ps_script = """
-        $currentPath = [Environment]::GetEnvironmentVariable('PATH', 'Machine')
-        $pathArray = $currentPath -split ';' | Where-Object { $_ -ne '' }
-
-        $newPaths = @({paths})
-
-        foreach ($newPath in $newPaths) {{
-            if ($pathArray -notcontains $newPath) {{
-                $pathArray += $newPath
-                Write-Host "추가하는 중: $newPath"
-            }}
-        }}
-
-        $finalPath = $pathArray -join ';'
-
-        # This method triggers immediate propagation
-        [Environment]::SetEnvironmentVariable('PATH', $finalPath, 'Machine')
-
-        # Force refresh for current session
-        $env:PATH = $finalPath + ';' + [Environment]::GetEnvironmentVariable('PATH', 'User')
-
-        Write-Host "PATH가 성공적으로 업데이트되었습니다"
-        """.format(paths="'" + "','".join(paths_to_add) + "'")
+            # Update-Path is defined once per host (see _HOST_FUNCTIONS)
+            ps_script = f"Update-Path {_ps_array(_unique_paths(paths_to_add))}"
 
             success, output = self.execute_script(ps_script)
 
             if success:
-                print("PowerShell PATH 업데이트 성공")
-                print(output)
+                self._log("PowerShell PATH 업데이트 성공")
+                self._log(output)
                 return True
             else:
-                print(f"PowerShell PATH 업데이트 실패: {output}")
+                self._log(f"PowerShell PATH 업데이트 실패: {output}")
                 return False
 
         except Exception as e:
-            print(f"PowerShell 방법 실패: {e}")
+            self._log(f"PowerShell 방법 실패: {e}")
             return False
 
 
@@ -5,66 +5,183 @@ Brain Module System v4.0
 """
 
 import winreg
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+# Buffered log messages are flushed once this many are pending
+_LOG_FLUSH_THRESHOLD = 16
 
 
 class RegistryOperations:
     """Low-level registry operations for PATH"""
 
-    def __init__(self):
-        """Initialize registry paths"""
+    def __init__(self, log_callback: Optional[Callable] = None):
+        """
+        Initialize registry paths
+
+        Args:
+            log_callback: Optional callback for log messages (printed if None)
+        """
+        self.log_callback = log_callback
+        self._log_buffer: Optional[List[str]] = None  # list while session() is open
+
         self.SYSTEM_ENV_KEY = r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment'
         self.USER_ENV_KEY = r'Environment'
 
-    def read_system_path(self) -> List[str]:
+        # Handles held open by session() (None = open per call)
+        self._hklm = None
+        self._hkcu = None
+
+        # PATH values read during this run (None = not read yet)
+        self._sys_path_cache: Optional[List[str]] = None
+        self._user_path_cache: Optional[List[str]] = None
+
+    def invalidate(self) -> None:
+        """Drop cached PATH reads (call after the registry is changed externally)"""
+        self._sys_path_cache = None
+        self._user_path_cache = None
+
+    @contextmanager
+    def session(self):
+        """
+        Keep the system and user Environment keys open for the duration of the block
+
+        All reads and writes inside the block reuse the same two handles instead of
+        opening and closing a key per call. Nested sessions reuse the outer one.
+        """
+        if self._hklm is not None or self._hkcu is not None:
+            yield self
+            return
+
+        self._hklm = self._open_session_key(
+            winreg.HKEY_LOCAL_MACHINE, self.SYSTEM_ENV_KEY, winreg.KEY_WOW64_64KEY
+        )
+        self._hkcu = self._open_session_key(winreg.HKEY_CURRENT_USER, self.USER_ENV_KEY)
+        self._log_buffer = []
+        try:
+            yield self
+        finally:
+            for key in (self._hklm, self._hkcu):
+                if key is not None:
+                    winreg.CloseKey(key)
+            self._hklm = None
+            self._hkcu = None
+            self._flush_log()
+            self._log_buffer = None
+
+    def _log(self, message: str) -> None:
+        """Log a message; buffered while a session is open"""
+        if self._log_buffer is None:
+            self._emit(message)
+            return
+        self._log_buffer.append(message)
+        if len(self._log_buffer) >= _LOG_FLUSH_THRESHOLD:
+            self._flush_log()
+
+    def _flush_log(self) -> None:
+        """Write buffered log messages in one call"""
+        if self._log_buffer:
+            self._emit("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def _emit(self, text: str) -> None:
+        if self.log_callback:
+            self.log_callback(text)
+        else:
+            print(text)
+
+    @staticmethod
+    def _open_session_key(root_key, key_path: str, view: int = 0):
+        """Open a key for read/write, falling back to read-only without admin rights"""
+        try:
+            return winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ | winreg.KEY_WRITE | view)
+        except PermissionError:
+            pass
+        except OSError:
+            return None
+        try:
+            return winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ | view)
+        except OSError:
+            return None
+
+    def _acquire(self, user: bool, access: int):
+        """
+        Get a key handle for the user or system environment
+
+        Returns:
+            (key, owned) - owned keys must be closed by the caller via _release()
+        """
+        cached = self._hkcu if user else self._hklm
+        if cached is not None:
+            return cached, False
+
+        if user:
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.USER_ENV_KEY, 0, access)
+        else:
+            # Always use the 64-bit registry view, even from 32-bit Python
+            key = winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE, self.SYSTEM_ENV_KEY, 0, access | winreg.KEY_WOW64_64KEY
+            )
+        return key, True
+
+    @staticmethod
+    def _release(key, owned: bool) -> None:
+        if owned:
+            winreg.CloseKey(key)
+
+    def read_system_path(self, refresh: bool = False) -> List[str]:
         """
         Read system PATH from registry
 
+        Args:
+            refresh: Bypass the cached value and read the registry again
+
         Returns:
             List of paths in system PATH, empty list if error
         """
+        if self._sys_path_cache is not None and not refresh:
+            return list(self._sys_path_cache)
+
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                self.SYSTEM_ENV_KEY,
-                0,
-                winreg.KEY_READ
-            )
+            key, owned = self._acquire(False, winreg.KEY_READ)
 
             try:
                 system_path, _ = winreg.QueryValueEx(key, 'Path')
                 path_list = [p.strip() for p in system_path.split(';') if p.strip()]
-                return path_list
+                self._sys_path_cache = path_list
+                return list(path_list)
             except:
                 return []
             finally:
-                winreg.CloseKey(key)
+                self._release(key, owned)
         except:
             return []
 
-    def read_user_path(self) -> List[str]:
+    def read_user_path(self, refresh: bool = False) -> List[str]:
         """
         Read user PATH from registry
 
+        Args:
+            refresh: Bypass the cached value and read the registry again
+
         Returns:
             List of paths in user PATH, empty list if error
         """
+        if self._user_path_cache is not None and not refresh:
+            return list(self._user_path_cache)
+
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.USER_ENV_KEY,
-                0,
-                winreg.KEY_READ
-            )
+            key, owned = self._acquire(True, winreg.KEY_READ)
 
             try:
                 user_path, _ = winreg.QueryValueEx(key, 'Path')
                 path_list = [p.strip() for p in user_path.split(';') if p.strip()]
-                return path_list
+                self._user_path_cache = path_list
+                return list(path_list)
             except:
                 return []
             finally:
-                winreg.CloseKey(key)
+                self._release(key, owned)
         except:
             return []
 
@@ -79,27 +196,25 @@ class RegistryOperations:
             True if successful, False otherwise
         """
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                self.SYSTEM_ENV_KEY,
-                0,
-                winreg.KEY_READ | winreg.KEY_WRITE
-            )
+            key, owned = self._acquire(False, winreg.KEY_READ | winreg.KEY_WRITE)
 
-            # Join paths with semicolon
-            new_path_value = ';'.join(paths)
+            try:
+                # Join paths with semicolon
+                new_path_value = ';'.join(paths)
 
-            # Write to registry using REG_EXPAND_SZ type
-            winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path_value)
-            winreg.CloseKey(key)
+                # Write to registry using REG_EXPAND_SZ type
+                winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path_value)
+            finally:
+                self._release(key, owned)
 
+            self._sys_path_cache = None
             return True
 
         except PermissionError:
-            print("[ERROR] Permission denied. System PATH requires administrator privileges.")
+            self._log("[ERROR] Permission denied. System PATH requires administrator privileges.")
             return False
         except Exception as e:
-            print(f"[ERROR] Failed to write system PATH: {e}")
+            self._log(f"[ERROR] Failed to write system PATH: {e}")
             return False
 
     def write_user_path(self, paths: List[str]) -> bool:
@@ -113,27 +228,25 @@ class RegistryOperations:
             True if successful, False otherwise
         """
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.USER_ENV_KEY,
-                0,
-                winreg.KEY_READ | winreg.KEY_WRITE
-            )
+            key, owned = self._acquire(True, winreg.KEY_READ | winreg.KEY_WRITE)
 
-            # Join paths with semicolon
-            new_path_value = ';'.join(paths)
+            try:
+                # Join paths with semicolon
+                new_path_value = ';'.join(paths)
 
-            # Write to registry using REG_EXPAND_SZ type
-            winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path_value)
-            winreg.CloseKey(key)
+                # Write to registry using REG_EXPAND_SZ type
+                winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path_value)
+            finally:
+                self._release(key, owned)
 
+            self._user_path_cache = None
             return True
 
         except PermissionError:
-            print("[ERROR] Permission denied. Cannot write to user PATH.")
+            self._log("[ERROR] Permission denied. Cannot write to user PATH.")
             return False
         except Exception as e:
-            print(f"[ERROR] Failed to write user PATH: {e}")
+            self._log(f"[ERROR] Failed to write user PATH: {e}")
             return False
 
     def write_environment_variable(
@@ -154,34 +267,24 @@ class RegistryOperations:
             True if successful, False otherwise
         """
         try:
-            if user:
-                key_path = self.USER_ENV_KEY
-                root_key = winreg.HKEY_CURRENT_USER
-            else:
-                key_path = self.SYSTEM_ENV_KEY
-                root_key = winreg.HKEY_LOCAL_MACHINE
+            key, owned = self._acquire(user, winreg.KEY_READ | winreg.KEY_WRITE)
 
-            key = winreg.OpenKey(
-                root_key,
-                key_path,
-                0,
-                winreg.KEY_READ | winreg.KEY_WRITE
-            )
-
-            # Write to registry using REG_SZ type
-            winreg.SetValueEx(key, name, 0, winreg.REG_SZ, value)
-            winreg.CloseKey(key)
+            try:
+                # Write to registry using REG_SZ type
+                winreg.SetValueEx(key, name, 0, winreg.REG_SZ, value)
+            finally:
+                self._release(key, owned)
 
             scope = "user" if user else "system"
-            print(f"[OK] Environment variable set ({scope}): {name} = {value}")
+            self._log(f"[OK] Environment variable set ({scope}): {name} = {value}")
             return True
 
         except PermissionError:
             scope = "user" if user else "system"
-            print(f"[ERROR] Permission denied. Cannot write to {scope} environment.")
+            self._log(f"[ERROR] Permission denied. Cannot write to {scope} environment.")
             return False
         except Exception as e:
-            print(f"[ERROR] Failed to set environment variable {name}: {e}")
+            self._log(f"[ERROR] Failed to set environment variable {name}: {e}")
             return False
 
     def read_environment_variable(
@@ -200,19 +303,7 @@ class RegistryOperations:
             Variable value if found, None otherwise
         """
         try:
-            if user:
-                key_path = self.USER_ENV_KEY
-                root_key = winreg.HKEY_CURRENT_USER
-            else:
-                key_path = self.SYSTEM_ENV_KEY
-                root_key = winreg.HKEY_LOCAL_MACHINE
-
-            key = winreg.OpenKey(
-                root_key,
-                key_path,
-                0,
-                winreg.KEY_READ
-            )
+            key, owned = self._acquire(user, winreg.KEY_READ)
 
             try:
                 value, _ = winreg.QueryValueEx(key, name)
@@ -220,11 +311,37 @@ class RegistryOperations:
             except:
                 return None
             finally:
-                winreg.CloseKey(key)
+                self._release(key, owned)
 
         except:
             return None
 
+    def read_all_environment_variables(self, user: bool = False) -> Dict[str, str]:
+        """
+        Read every environment variable of one scope with a single key open
+
+        Args:
+            user: If True, read user environment; if False, read system
+
+        Returns:
+            Mapping of variable name to value, empty dict if error
+        """
+        try:
+            key, owned = self._acquire(user, winreg.KEY_READ)
+
+            try:
+                value_count = winreg.QueryInfoKey(key)[1]
+                variables = {}
+                for i in range(value_count):
+                    name, value, _ = winreg.EnumValue(key, i)
+                    variables[name] = value
+                return variables
+            finally:
+                self._release(key, owned)
+
+        except:
+            return {}
+
     def delete_environment_variable(
         self,
         name: str,
@@ -241,37 +358,27 @@ class RegistryOperations:
             True if successful, False otherwise
         """
         try:
-            if user:
-                key_path = self.USER_ENV_KEY
-                root_key = winreg.HKEY_CURRENT_USER
-            else:
-                key_path = self.SYSTEM_ENV_KEY
-                root_key = winreg.HKEY_LOCAL_MACHINE
+            key, owned = self._acquire(user, winreg.KEY_READ | winreg.KEY_WRITE)
 
-            key = winreg.OpenKey(
-                root_key,
-                key_path,
-                0,
-                winreg.KEY_READ | winreg.KEY_WRITE
-            )
-
-            # Delete the value
-            winreg.DeleteValue(key, name)
-            winreg.CloseKey(key)
+            try:
+                # Delete the value
+                winreg.DeleteValue(key, name)
+            finally:
+                self._release(key, owned)
 
             scope = "user" if user else "system"
-            print(f"[OK] Environment variable deleted ({scope}): {name}")
+            self._log(f"[OK] Environment variable deleted ({scope}): {name}")
             return True
 
         except FileNotFoundError:
-            print(f"[INFO] Environment variable not found: {name}")
+            self._log(f"[INFO] Environment variable not found: {name}")
             return False
         except PermissionError:
             scope = "user" if user else "system"
-            print(f"[ERROR] Permission denied. Cannot delete from {scope} environment.")
+            self._log(f"[ERROR] Permission denied. Cannot delete from {scope} environment.")
             return False
         except Exception as e:
-            print(f"[ERROR] Failed to delete environment variable {name}: {e}")
+            self._log(f"[ERROR] Failed to delete environment variable {name}: {e}")
             return False
 
 
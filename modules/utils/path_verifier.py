@@ -3,6 +3,8 @@ PATH Verifier Module - Facade Pattern
 Dual verification system: Registry + Execution
 Brain Module System v4.0
 """
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
 # Handle both relative and absolute imports
@@ -15,11 +17,46 @@ except ImportError:
     from verifier_components.tool_executor import ToolExecutor
     from verifier_components.verification_ui import VerificationUI, TerminalVerificationUI
 
-try:
-    from modules.core.config import Config
-    _config = Config()
-except Exception:
-    _config = None
+
+@lru_cache(maxsize=1)
+def _get_config():
+    """Config for production mode detection, created on first use"""
+    try:
+        from modules.core.config import Config
+        return Config()
+    except Exception:
+        # Fallback if Config is not available or initialization fails
+        return None
+
+
+# 검증 대상 도구 정의 - 모든 PathVerifier 인스턴스가 공유 (수정 금지)
+TOOLS = {
+    'Git': {
+        'command': 'git',
+        'args': ('--version',),
+        'expected_paths': ('Git\\cmd', 'Git\\bin')
+    },
+    'Node.js': {
+        'command': 'node',
+        'args': ('--version',),
+        'expected_paths': ('nodejs',)
+    },
+    'NPM': {
+        'command': 'npm',
+        'args': ('--version',),
+        'expected_paths': ('nodejs', 'npm')
+    },
+    'Claude CLI': {
+        'command': 'claude',
+        'args': ('--version',),
+        'expected_paths': ('npm',)
+    },
+    'Gemini CLI': {
+        'command': 'gemini',
+        'args': ('--version',),
+        'expected_paths': ('npm',)
+    }
+}
 
 
 class PathVerifier:
@@ -34,36 +71,10 @@ class PathVerifier:
         self.registry_checker = RegistryChecker(log_callback)
         self.tool_executor = ToolExecutor(log_callback)
         self.verification_ui = None
-        self.terminal_ui = TerminalVerificationUI(log_callback, _config)
-
-        # Tool definitions
-        self.tools = {
-            'Git': {
-                'command': 'git',
-                'args': ['--version'],
-                'expected_paths': ['Git\\cmd', 'Git\\bin']
-            },
-            'Node.js': {
-                'command': 'node',
-                'args': ['--version'],
-                'expected_paths': ['nodejs']
-            },
-            'NPM': {
-                'command': 'npm',
-                'args': ['--version'],
-                'expected_paths': ['nodejs', 'npm']
-            },
-            'Claude CLI': {
-                'command': 'claude',
-                'args': ['--version'],
-                'expected_paths': ['npm']
-            },
-            'Gemini CLI': {
-                'command': 'gemini',
-                'args': ['--version'],
-                'expected_paths': ['npm']
-            }
-        }
+        self.terminal_ui = TerminalVerificationUI(log_callback, _get_config())
+
+        # Tool definitions (shared, read-only)
+        self.tools = TOOLS
 
     def log(self, message: str):
         """Log a message"""
@@ -109,6 +120,16 @@ class PathVerifier:
         """
         return self.tool_executor.execute_tool(tool_name, command_info)
 
+    def verify_tools_batch(self) -> Dict[str, Dict]:
+        """
+        Verify all tools in one new process
+        Delegates to ToolExecutor
+
+        Returns:
+            dict: Tool name -> verification result (see verify_single_tool)
+        """
+        return self.tool_executor.execute_tools_batch(self.tools)
+
     def verify_with_comparison(self) -> Dict:
         """
         Verify all tools using both methods and compare results
@@ -124,13 +145,19 @@ class PathVerifier:
         self.log("=" * 60)
         self.log("")
 
-        for tool_name, command_info in self.tools.items():
+        # Dual verification: one batched execution test runs in the background
+        # while the registry side is evaluated for every tool from one registry read
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            execution_future = executor.submit(self.verify_tools_batch)
+            registry_results = self.registry_checker.check_tools_in_registry(self.tools)
+            execution_results = execution_future.result()
+
+        for tool_name in self.tools:
             self.log(f"{tool_name} 확인 중...")
             self.log("-" * 40)
 
-            # Dual verification: Registry + Execution
-            registry_result = self.check_tool_in_registry_path(tool_name, command_info)
-            execution_result = self.verify_single_tool(tool_name, command_info)
+            registry_result = registry_results[tool_name]
+            execution_result = execution_results[tool_name]
 
             # Build comparison
             comparison = {
@@ -210,12 +237,14 @@ class PathVerifier:
 
     def verify_all_silent(self) -> List[Dict]:
         """Verify all tools silently - quick verification without comparison"""
-        results = []
         self.log("새 프로세스에서 PATH 검증 시작...")
-        for tool_name, command_info in self.tools.items():
+
+        # 모든 도구를 하나의 프로세스에서 실행 테스트 (로그는 완료 후 순서대로 출력)
+        batch = self.verify_tools_batch()
+        results = [batch[tool_name] for tool_name in self.tools]
+
+        for tool_name, result in zip(self.tools, results):
             self.log(f"{tool_name} 검증 중...")
-            result = self.verify_single_tool(tool_name, command_info)
-            results.append(result)
 
             # 실행 가능하면 메시지 없음 (성공 시 조용히)
             if result['status'] == 'success':
@@ -5,20 +5,50 @@ Brain Module System v4.0
 """
 
 import os
+import shutil
+import stat
 import subprocess
-from typing import List, Callable, Optional
+from functools import lru_cache
+from typing import Dict, List, Callable, Optional
 
-# Import Config for production mode detection
-try:
-    from modules.core.config import Config
-    _config = Config()
-except ImportError:
-    _config = None
+from ..logger import _LEVEL_RANK
+
+
+@lru_cache(maxsize=1)
+def _get_config():
+    """Config for production mode detection, created on first use (None if unavailable)"""
+    try:
+        from modules.core.config import Config
+        return Config()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _flags() -> int:
+    """Subprocess creation flags (fixed once Config is initialized)"""
+    config = _get_config()
+    return config.get_subprocess_flags() if config else 0
+
+
+@lru_cache(maxsize=1)
+def _default_log_level() -> int:
+    """Lowest level rank that is logged: DEBUG only outside production mode"""
+    config = _get_config()
+    return _LEVEL_RANK['DEBUG' if config and not config.is_production_mode() else 'INFO']
+
+
+def _is_file(path: str) -> bool:
+    """Single stat: True for a regular file (a missing directory is just an OSError)"""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
 
 
 # Known installation paths for each tool
 TOOL_PATHS = {
-    'git': [
+    'git': (
         r"C:\Program Files\Git\cmd",
         r"C:\Program Files\Git\bin",
         r"C:\Program Files (x86)\Git\cmd",
@@ -28,34 +58,93 @@ TOOL_PATHS = {
         # Chocolatey installation path
         r"C:\ProgramData\chocolatey\lib\git.install\tools\cmd",
         r"C:\ProgramData\chocolatey\lib\git.install\tools\bin"
-    ],
-    'nodejs': [
+    ),
+    'nodejs': (
         r"C:\Program Files\nodejs",
         r"C:\Program Files (x86)\nodejs",
         r"C:\nodejs",
         # Chocolatey installation path
         r"C:\ProgramData\chocolatey\lib\nodejs\tools",
         r"C:\ProgramData\chocolatey\lib\nodejs.install\tools"
-    ],
-    'npm': [
+    ),
+    'npm': (
         r"C:\Program Files\nodejs",
         r"C:\Program Files (x86)\nodejs",
         r"C:\Users\%USERNAME%\AppData\Roaming\npm",
         r"C:\ProgramData\npm"
-    ]
+    )
 }
 
 
+@lru_cache(maxsize=256)
+def _expand_path(path: str) -> str:
+    """Expand ~ and environment variables (memoized; the same entries recur)"""
+    return os.path.expandvars(os.path.expanduser(path))
+
+
+# TOOL_PATHS with %VARS% expanded once (they do not change within the process)
+_EXPANDED_TOOL_PATHS = {
+    tool: tuple(_expand_path(p) for p in paths)
+    for tool, paths in TOOL_PATHS.items()
+}
+
+
+# Successful check_tool_in_path results per command name, shared for the whole session.
+# Failures are not cached so a check after installing the tool runs again
+_PROBE_CACHE: Dict[str, bool] = {}
+
+
+def _probe_tool(tool_name: str) -> bool:
+    """Run '<tool> --version' and cache it once it succeeds"""
+    if _PROBE_CACHE.get(tool_name):
+        return True
+
+    # Resolve via PATH/PATHEXT and launch directly (no cmd.exe)
+    exe = shutil.which(tool_name)
+    if exe is None:
+        return False
+
+    try:
+        result = subprocess.run(
+            [exe, "--version"],
+            shell=False,
+            capture_output=True,
+            text=True,
+            timeout=5,
+            creationflags=_flags()
+        )
+        found = result.returncode == 0
+    except Exception:
+        found = False
+
+    if found:
+        _PROBE_CACHE[tool_name] = True
+    return found
+
+
 class PathDiscovery:
     """Handles tool path discovery and verification"""
 
+    # Executable file names that mark a valid installation directory (in preference order)
+    _TOOL_EXES = {
+        'git': ('git.exe',),
+        'nodejs': ('node.exe',),
+        'npm': ('npm.cmd', 'npm.exe'),
+    }
+
+    # Command names to look up on PATH before scanning known locations
+    _TOOL_COMMANDS = {'git': 'git', 'nodejs': 'node', 'npm': 'npm'}
+
     def __init__(self, log_callback: Optional[Callable] = None):
         """Initialize path discovery with optional logging callback"""
         self.log_callback = log_callback
-        self.tool_paths = TOOL_PATHS
+        self._log_level = _default_log_level()
+        self.tool_paths = _EXPANDED_TOOL_PATHS
 
     def _log(self, message: str, level: str = "INFO"):
         """Log a message"""
+        if _LEVEL_RANK.get(level, 1) < self._log_level:
+            return
         if self.log_callback:
             self.log_callback(f"[{level}] {message}")
         else:
@@ -63,7 +152,7 @@ class PathDiscovery:
 
     def _expand_path(self, path: str) -> str:
         """Expand environment variables in path"""
-        return os.path.expandvars(os.path.expanduser(path))
+        return _expand_path(path)
 
     def check_tool_in_path(self, tool_name: str) -> bool:
         """
@@ -75,21 +164,19 @@ class PathDiscovery:
         Returns:
             bool: True if tool is accessible
         """
-        try:
-            # Try to run the tool with --version
-            cmd = f"{tool_name} --version"
-            creationflags = _config.get_subprocess_flags() if _config else 0
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=5,
-                creationflags=creationflags
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return _probe_tool(tool_name)
+
+    def invalidate_cache(self, tool_name: Optional[str] = None) -> None:
+        """
+        Forget cached check_tool_in_path results (call after PATH changes)
+
+        Args:
+            tool_name: Tool to forget; all tools if None
+        """
+        if tool_name is None:
+            _PROBE_CACHE.clear()
+        else:
+            _PROBE_CACHE.pop(tool_name, None)
 
     def find_tool_installation(self, tool_name: str) -> List[str]:
         """
@@ -107,26 +194,22 @@ class PathDiscovery:
             self._log(f"알 수 없는 도구: {tool_name}", "WARNING")
             return found_paths
 
-        # Check each possible path
-        for path in self.tool_paths[tool_name]:
-            expanded_path = self._expand_path(path)
-
-            # Check if directory exists
-            if os.path.exists(expanded_path):
-                # Verify tool executable exists in the path
-                if tool_name == 'git':
-                    exe_path = os.path.join(expanded_path, 'git.exe')
-                elif tool_name == 'nodejs':
-                    exe_path = os.path.join(expanded_path, 'node.exe')
-                elif tool_name == 'npm':
-                    exe_path = os.path.join(expanded_path, 'npm.cmd')
-                    if not os.path.exists(exe_path):
-                        exe_path = os.path.join(expanded_path, 'npm.exe')
-                else:
-                    continue
-
-                if os.path.exists(exe_path):
-                    found_paths.append(expanded_path)
+        exes = self._TOOL_EXES.get(tool_name)
+        if not exes:
+            return found_paths
+
+        # Common case: already resolvable on PATH, no need to scan known locations
+        hit = shutil.which(self._TOOL_COMMANDS[tool_name])
+        if hit and os.path.exists(hit):
+            return [os.path.dirname(hit)]
+
+        debug = _LEVEL_RANK['DEBUG'] >= self._log_level
+
+        # Stat the executable directly; no separate directory existence check
+        for expanded_path in self.tool_paths[tool_name]:
+            if any(_is_file(os.path.join(expanded_path, exe)) for exe in exes):
+                found_paths.append(expanded_path)
+                if debug:
                     self._log(f"{tool_name}을(를) 다음 위치에서 찾았습니다: {expanded_path}", "DEBUG")
 
         return found_paths
@@ -4,9 +4,13 @@ Windows registry PATH reading operations
 Brain Module System v4.0
 """
 
+import os
 import winreg
 from typing import List, Callable, Optional
 
+from ..logger import _LEVEL_RANK
+from .path_discovery import _default_log_level
+
 
 class PathRegistry:
     """Handles Windows registry PATH operations"""
@@ -14,18 +18,79 @@ class PathRegistry:
     def __init__(self, log_callback: Optional[Callable] = None):
         """Initialize with optional logging callback"""
         self.log_callback = log_callback
+        self._log_level = _default_log_level()
+
+        # Parsed PATH lists; None until read, reset by invalidate()
+        self._sys_cache: Optional[List[str]] = None
+        self._usr_cache: Optional[List[str]] = None
+
+        # Environment key handles held between open_keys() and close_keys()
+        self._hklm_key = None
+        self._hkcu_key = None
+
+    def open_keys(self) -> bool:
+        """
+        Open the system and user Environment keys once for repeated PATH reads
+
+        Returns:
+            bool: True if this call opened the keys (caller should close_keys())
+        """
+        if self._hklm_key is not None or self._hkcu_key is not None:
+            return False
+        try:
+            self._hklm_key = winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment',
+                0,
+                winreg.KEY_READ
+            )
+        except OSError:
+            self._hklm_key = None
+        try:
+            self._hkcu_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Environment', 0, winreg.KEY_READ)
+        except OSError:
+            self._hkcu_key = None
+        return True
+
+    def close_keys(self) -> None:
+        """Close handles opened by open_keys()"""
+        for key in (self._hklm_key, self._hkcu_key):
+            if key is not None:
+                winreg.CloseKey(key)
+        self._hklm_key = None
+        self._hkcu_key = None
 
     def _log(self, message: str, level: str = "INFO"):
         """Log a message"""
+        if _LEVEL_RANK.get(level, 1) < self._log_level:
+            return
         if self.log_callback:
             self.log_callback(f"[{level}] {message}")
         else:
             print(f"[{level}] {message}")
 
+    def invalidate(self) -> None:
+        """Forget cached PATH lists (call after writing PATH)"""
+        self._sys_cache = None
+        self._usr_cache = None
+
     def get_current_system_path(self) -> List[str]:
-        """Get current system PATH from registry"""
+        """Get current system PATH from registry (cached until invalidate())"""
+        if self._sys_cache is None:
+            self._sys_cache = self._read_system_path()
+        return list(self._sys_cache)
+
+    def get_current_user_path(self) -> List[str]:
+        """Get current user PATH from registry (cached until invalidate())"""
+        if self._usr_cache is None:
+            self._usr_cache = self._read_user_path()
+        return list(self._usr_cache)
+
+    def _read_system_path(self) -> List[str]:
+        """Read system PATH from registry"""
         try:
-            key = winreg.OpenKey(
+            owned = self._hklm_key is None
+            key = self._hklm_key if not owned else winreg.OpenKey(
                 winreg.HKEY_LOCAL_MACHINE,
                 r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment',
                 0,
@@ -34,17 +99,19 @@ class PathRegistry:
 
             try:
                 system_path, _ = winreg.QueryValueEx(key, 'Path')
-                return [p.strip() for p in system_path.split(';') if p.strip()]
+                return list(filter(None, (p.strip() for p in system_path.split(os.pathsep))))
             finally:
-                winreg.CloseKey(key)
+                if owned:
+                    winreg.CloseKey(key)
         except Exception as e:
             self._log(f"시스템 PATH 읽기 실패: {e}", "ERROR")
             return []
 
-    def get_current_user_path(self) -> List[str]:
-        """Get current user PATH from registry"""
+    def _read_user_path(self) -> List[str]:
+        """Read user PATH from registry"""
         try:
-            key = winreg.OpenKey(
+            owned = self._hkcu_key is None
+            key = self._hkcu_key if not owned else winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 r'Environment',
                 0,
@@ -53,11 +120,12 @@ class PathRegistry:
 
             try:
                 user_path, _ = winreg.QueryValueEx(key, 'Path')
-                return [p.strip() for p in user_path.split(';') if p.strip()]
+                return list(filter(None, (p.strip() for p in user_path.split(os.pathsep))))
             except:
                 return []
             finally:
-                winreg.CloseKey(key)
+                if owned:
+                    winreg.CloseKey(key)
         except Exception:
             return []
 
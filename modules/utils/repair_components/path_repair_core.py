@@ -4,9 +4,12 @@ PATH diagnosis and repair orchestration
 Brain Module System v4.0
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Callable, Optional
 
-from .path_discovery import PathDiscovery
+from ..logger import _LEVEL_RANK
+from .path_discovery import PathDiscovery, _default_log_level
 from .path_registry import PathRegistry
 
 
@@ -15,6 +18,9 @@ class PathRepairManager:
     Manages PATH verification and automatic repair for installed tools
     """
 
+    # (command name, display name) for every tool that is diagnosed and verified
+    _TOOLS = (('git', 'Git'), ('node', 'Node.js'), ('npm', 'npm'))
+
     def __init__(self, log_callback: Optional[Callable] = None):
         """
         Initialize PATH Repair Manager
@@ -23,15 +29,20 @@ class PathRepairManager:
             log_callback: Optional callback function for logging
         """
         self.log_callback = log_callback
+        self._log_level = _default_log_level()
 
         # Initialize component modules
         self.discovery = PathDiscovery(log_callback)
         self.registry = PathRegistry(log_callback)
 
+        # Per-tool state from the latest diagnose_path_issues(), updated in place
+        # by auto_repair_all() and verify_repair()
         self.repair_results = {}
 
     def _log(self, message: str, level: str = "INFO"):
         """Log a message"""
+        if _LEVEL_RANK.get(level, 1) < self._log_level:
+            return
         if self.log_callback:
             self.log_callback(f"[{level}] {message}")
         else:
@@ -65,15 +76,26 @@ class PathRepairManager:
         self._log("=" * 60)
 
         diagnosis = {}
-        system_path = self.registry.get_current_system_path()
-        user_path = self.registry.get_current_user_path()
-        all_paths = system_path + user_path
-
-        tools_to_check = [
-            ('git', 'Git'),
-            ('node', 'Node.js'),
-            ('npm', 'npm')
-        ]
+        # Read both PATH values concurrently through one pair of key handles
+        opened = self.registry.open_keys()
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                system_future = executor.submit(self.registry.get_current_system_path)
+                user_future = executor.submit(self.registry.get_current_user_path)
+                system_path = system_future.result()
+                user_path = user_future.result()
+        finally:
+            if opened:
+                self.registry.close_keys()
+        # Normalized (case/separator-insensitive) set for O(1) membership checks
+        path_set = frozenset(os.path.normcase(os.path.normpath(p)) for p in system_path + user_path)
+
+        tools_to_check = self._TOOLS
+
+        # Probe all tools concurrently; logging below stays in order
+        cmd_names = [cmd_name for cmd_name, _ in tools_to_check]
+        with ThreadPoolExecutor(max_workers=len(cmd_names)) as executor:
+            probes = dict(zip(cmd_names, executor.map(self.discovery.check_tool_in_path, cmd_names)))
 
         for cmd_name, display_name in tools_to_check:
             self._log(f"\n{display_name} 확인 중...")
@@ -90,7 +112,7 @@ class PathRepairManager:
             }
 
             # Check if tool works
-            result['in_path'] = self.discovery.check_tool_in_path(cmd_name)
+            result['in_path'] = probes[cmd_name]
 
             if result['in_path']:
                 self._log(f"  [OK] {display_name}이(가) 정상적으로 작동합니다", "SUCCESS")
@@ -106,7 +128,7 @@ class PathRepairManager:
 
                     # Check which are missing from PATH
                     for install_path in installations:
-                        if install_path not in all_paths:
+                        if os.path.normcase(os.path.normpath(install_path)) not in path_set:
                             result['missing_from_path'].append(install_path)
                             self._log(f"    - PATH에서 누락됨: {install_path}", "WARNING")
 
@@ -118,6 +140,7 @@ class PathRepairManager:
 
             diagnosis[cmd_name] = result
 
+        self.repair_results = diagnosis
         return diagnosis
 
     def repair_path_for_tool(self, tool_name: str, missing_paths: List[str]) -> bool:
@@ -169,6 +192,12 @@ class PathRepairManager:
             self._log(f"  [X] PATH 복구 실패: {e}", "ERROR")
             return False
 
+        finally:
+            # PATH may have changed; a shared directory (e.g. nodejs) can fix
+            # several tools, so drop every cached probe and registry read
+            self.discovery.invalidate_cache()
+            self.registry.invalidate()
+
     def auto_repair_all(self) -> Tuple[bool, Dict]:
         """
         Automatically diagnose and repair all PATH issues
@@ -197,22 +226,26 @@ class PathRepairManager:
         self._log(f"\n{len(tools_needing_repair)}개의 도구가 PATH 복구를 필요로 합니다")
         self._log("-" * 40)
 
-        repair_success = True
-        for tool_name, info in tools_needing_repair:
-            display_name = info['display_name']
-            missing_paths = info['missing_from_path']
-
-            if missing_paths:
-                success = self.repair_path_for_tool(display_name, missing_paths)
-                info['repair_attempted'] = True
-                info['repair_success'] = success
+        from ..path_manager import registry_session
 
-                if not success:
-                    repair_success = False
-            else:
-                self._log(f"\n[!] {display_name}이(가) 설치되지 않았습니다", "WARNING")
-                info['repair_attempted'] = False
-                info['repair_success'] = False
+        repair_success = True
+        # Reuse the Environment registry handles across all repairs
+        with registry_session():
+            for tool_name, info in tools_needing_repair:
+                display_name = info['display_name']
+                missing_paths = info['missing_from_path']
+
+                if missing_paths:
+                    success = self.repair_path_for_tool(display_name, missing_paths)
+                    info['repair_attempted'] = True
+                    info['repair_success'] = success
+
+                    if not success:
+                        repair_success = False
+                else:
+                    self._log(f"\n[!] {display_name}이(가) 설치되지 않았습니다", "WARNING")
+                    info['repair_attempted'] = False
+                    info['repair_success'] = False
 
         # Final summary
         self._log("\n" + "=" * 60)
@@ -241,28 +274,49 @@ class PathRepairManager:
 
         return repair_success, diagnosis
 
-    def verify_repair(self) -> Dict[str, bool]:
+    def verify_repair(self, diagnosis: Optional[Dict[str, Dict]] = None) -> Dict[str, bool]:
         """
         Verify if repairs were successful
 
+        Args:
+            diagnosis: Result of diagnose_path_issues()/auto_repair_all() (defaults to
+                       self.repair_results); tools that already worked and were not
+                       repaired are not probed again, others get 'in_path' updated
+
         Returns:
             Dictionary of tool_name: is_working
         """
         self._log("\nPATH 복구를 검증하는 중...")
 
+        tools = self._TOOLS
+        if diagnosis is None:
+            diagnosis = self.repair_results
+
         results = {}
-        tools = [('git', 'Git'), ('node', 'Node.js'), ('npm', 'npm')]
+        to_probe = []
+        for cmd_name, _ in tools:
+            info = diagnosis.get(cmd_name)
+            if info and info['in_path'] and not info.get('repair_attempted'):
+                results[cmd_name] = True
+            else:
+                to_probe.append(cmd_name)
 
-        for cmd_name, display_name in tools:
-            working = self.discovery.check_tool_in_path(cmd_name)
-            results[cmd_name] = working
+        # Probe remaining tools concurrently; logging below stays in order
+        if to_probe:
+            with ThreadPoolExecutor(max_workers=len(to_probe)) as executor:
+                results.update(zip(to_probe, executor.map(self.discovery.check_tool_in_path, to_probe)))
 
-            if working:
+        for cmd_name in to_probe:
+            if cmd_name in diagnosis:
+                diagnosis[cmd_name]['in_path'] = results[cmd_name]
+
+        for cmd_name, display_name in tools:
+            if results[cmd_name]:
                 self._log(f"  [OK] {display_name}에 이제 접근할 수 있습니다", "SUCCESS")
             else:
                 self._log(f"  [X] {display_name}에 여전히 접근할 수 없습니다", "WARNING")
 
-        return results
+        return {cmd_name: results[cmd_name] for cmd_name, _ in tools}
 
 
 __all__ = ['PathRepairManager']
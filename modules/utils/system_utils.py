@@ -7,14 +7,48 @@ import ctypes
 import sys
 import os
 import platform
+import shutil
+from functools import lru_cache
 
-# Import Config for production mode detection
-try:
-    from modules.core.config import Config
-    _config = Config()
-except Exception:
-    # Fallback if Config is not available or initialization fails
-    _config = None
+
+@lru_cache(maxsize=1)
+def _get_config():
+    """Config for production mode detection, created on first use"""
+    try:
+        from modules.core.config import Config
+        return Config()
+    except Exception:
+        # Fallback if Config is not available or initialization fails
+        return None
+
+
+@lru_cache(maxsize=1)
+def _flags():
+    """Subprocess creation flags (fixed once Config is initialized)"""
+    config = _get_config()
+    return config.get_subprocess_flags() if config else 0
+
+
+# Successful check_software_installed results keyed by (command_args, timeout).
+# Failures are not cached so a check after installing software runs again.
+_SW_CACHE = {}
+
+
+def _resolve_argv(command_args):
+    """
+    Resolve the executable of an argv list via PATH/PATHEXT (e.g. 'npm' -> 'npm.cmd')
+    so it can be launched without cmd.exe
+
+    Args:
+        command_args (list): Command and arguments
+
+    Returns:
+        list or None: argv with an absolute executable, or None if not on PATH
+    """
+    exe = shutil.which(command_args[0])
+    if exe is None:
+        return None
+    return [exe, *command_args[1:]]
 
 
 def is_admin():
@@ -88,20 +122,26 @@ def check_software_installed(software_name, command_args, timeout=5):
     Returns:
         tuple: (bool, str) - (is_installed, version_or_error)
     """
-    try:
-        # Get subprocess flags based on production mode
-        creationflags = _config.get_subprocess_flags() if _config else 0
+    cache_key = (tuple(command_args), timeout)
+    if cache_key in _SW_CACHE:
+        return True, _SW_CACHE[cache_key]
+
+    argv = _resolve_argv(command_args)
+    if argv is None:
+        return False, None
 
+    try:
         result = subprocess.run(
-            command_args,
+            argv,
             capture_output=True,
             text=True,
-            shell=True,
+            shell=False,
             timeout=timeout,
-            creationflags=creationflags
+            creationflags=_flags()
         )
         if result.returncode == 0:
-            return True, result.stdout.strip()
+            _SW_CACHE[cache_key] = result.stdout.strip()
+            return True, _SW_CACHE[cache_key]
         return False, None
     except subprocess.TimeoutExpired:
         return False, f"명령이 {timeout}초 후 시간 초과되었습니다"
@@ -128,46 +168,50 @@ def check_package_manager(manager_type):
     if manager_type not in commands:
         return False
 
-    try:
-        # Get subprocess flags based on production mode
-        creationflags = _config.get_subprocess_flags() if _config else 0
+    argv = _resolve_argv(commands[manager_type])
+    if argv is None:
+        return False
 
+    try:
         result = subprocess.run(
-            commands[manager_type],
+            argv,
             capture_output=True,
             text=True,
-            shell=True,
+            shell=False,
             timeout=5,
-            creationflags=creationflags
+            creationflags=_flags()
         )
         return result.returncode == 0
     except:
         return False
 
 
-def run_command_with_timeout(command, timeout=5, shell=True):
+def run_command_with_timeout(command, timeout=5, shell=None):
     """
     Run a command with a specified timeout
 
     Args:
         command (list or str): Command to run
         timeout (int): Timeout in seconds
-        shell (bool): Whether to use shell
+        shell (bool): Whether to use shell (default: only for string commands;
+                      list commands are resolved on PATH and run directly)
 
     Returns:
         tuple: (success, stdout, stderr, returncode)
     """
-    try:
-        # Get subprocess flags based on production mode
-        creationflags = _config.get_subprocess_flags() if _config else 0
+    if shell is None:
+        shell = isinstance(command, str)
+    if not shell and isinstance(command, list):
+        command = _resolve_argv(command) or command
 
+    try:
         result = subprocess.run(
             command,
             capture_output=True,
             text=True,
             shell=shell,
             timeout=timeout,
-            creationflags=creationflags
+            creationflags=_flags()
         )
         return True, result.stdout, result.stderr, result.returncode
     except subprocess.TimeoutExpired:
@@ -213,11 +257,36 @@ def find_executable_in_common_paths(executable_name, common_paths):
     """
     for path in common_paths:
         exe_path = os.path.join(path, executable_name)
-        if os.path.exists(exe_path):
+        if os.path.isfile(exe_path):
             return path
     return None
 
 
+@lru_cache(maxsize=1)
+def _fixed_drives():
+    """
+    Root paths of local fixed drives, enumerated once via GetLogicalDrives
+
+    Skipping missing letters and CD/network/removable drives avoids slow
+    drive-not-ready probes. Falls back to C:/D:/E: if enumeration fails.
+
+    Returns:
+        tuple: Drive roots such as ('C:\\', 'D:\\')
+    """
+    try:
+        kernel32 = ctypes.windll.kernel32
+        mask = kernel32.GetLogicalDrives()
+        drives = tuple(
+            f"{chr(ord('A') + i)}:\\" for i in range(26)
+            if mask & (1 << i) and kernel32.GetDriveTypeW(f"{chr(ord('A') + i)}:\\") == 3  # DRIVE_FIXED
+        )
+        if drives:
+            return drives
+    except Exception:
+        pass
+    return ('C:\\', 'D:\\', 'E:\\')
+
+
 def search_drives_for_executable(executable_name, search_subdirs):
     """
     Search multiple drives for an executable in specified subdirectories
@@ -229,11 +298,11 @@ def search_drives_for_executable(executable_name, search_subdirs):
     Returns:
         str or None: Path to the directory containing the executable if found, None otherwise
     """
-    for drive in ['C:', 'D:', 'E:']:
+    for drive in _fixed_drives():
         for subdir in search_subdirs:
             search_path = os.path.join(drive, subdir)
             exe_path = os.path.join(search_path, executable_name)
-            if os.path.exists(exe_path):
+            if os.path.isfile(exe_path):
                 return search_path
     return None
 
@@ -258,6 +327,19 @@ def ensure_directory_exists(directory_path):
         return False
 
 
+@lru_cache(maxsize=1)
+def _windows_version_info():
+    # 버전 정보는 프로세스 동안 바뀌지 않으므로 한 번만 조회
+    # (platform.processor()는 WMI를 호출할 수 있어 환경변수로 대체)
+    return {
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': os.environ.get('PROCESSOR_IDENTIFIER', platform.machine())
+    }
+
+
 def get_windows_version():
     """
     Get Windows version information
@@ -266,13 +348,7 @@ def get_windows_version():
         dict: Dictionary with version information
     """
     try:
-        return {
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'machine': platform.machine(),
-            'processor': platform.processor()
-        }
+        return dict(_windows_version_info())
     except Exception as e:
         print(f"Windows 버전 정보 가져오기 실패: {e}")
         return {}
\ No newline at end of file
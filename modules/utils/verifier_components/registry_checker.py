@@ -6,9 +6,47 @@ Brain Module System v4.0
 
 import winreg
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 
 
+@lru_cache(maxsize=1)
+def _get_config():
+    """Config for production mode detection, created on first use"""
+    try:
+        from modules.core.config import Config
+        return Config()
+    except Exception:
+        # Fallback if Config is not available or initialization fails
+        return None
+
+
+# Windows에서 확인할 실행 파일 확장자 (순서대로 우선)
+EXE_SUFFIXES = ('', '.exe', '.cmd', '.bat')
+
+
+@lru_cache(maxsize=256)
+def _expand(path: str) -> str:
+    """Expanded PATH segment (segments recur across tools and reads)"""
+    return os.path.expandvars(path)
+
+
+@lru_cache(maxsize=256)
+def _normalize(path: str) -> str:
+    """Comparison form of a PATH segment (normcase/normpath: case and separators unified)"""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _dir_file_names(path_dir: str) -> frozenset:
+    """Lowercased names of the files in a directory (empty if it cannot be listed)"""
+    try:
+        with os.scandir(path_dir) as entries:
+            return frozenset(e.name.lower() for e in entries if e.is_file())
+    except OSError:
+        return frozenset()
+
+
 class RegistryChecker:
     """Checks PATH in Windows registry"""
 
@@ -20,6 +58,45 @@ class RegistryChecker:
             log_callback: Optional callback for logging
         """
         self.log_callback = log_callback
+        # 환경변수 확장 로그는 디버그용 (프로덕션 모드에서는 생략)
+        config = _get_config()
+        self._debug = bool(config and not config.is_production_mode())
+
+        # Environment key handles held between open_keys() and close_keys()
+        self._hklm_key = None
+        self._hkcu_key = None
+
+    def open_keys(self) -> bool:
+        """
+        Open the Machine and User Environment keys once for repeated PATH reads
+
+        Returns:
+            bool: True if this call opened the keys (caller should close_keys())
+        """
+        if self._hklm_key is not None or self._hkcu_key is not None:
+            return False
+        try:
+            self._hklm_key = winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment',
+                0,
+                winreg.KEY_READ
+            )
+        except OSError:
+            self._hklm_key = None
+        try:
+            self._hkcu_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Environment', 0, winreg.KEY_READ)
+        except OSError:
+            self._hkcu_key = None
+        return True
+
+    def close_keys(self) -> None:
+        """Close handles opened by open_keys()"""
+        for key in (self._hklm_key, self._hkcu_key):
+            if key is not None:
+                winreg.CloseKey(key)
+        self._hklm_key = None
+        self._hkcu_key = None
 
     def log(self, message: str):
         """Log a message"""
@@ -36,8 +113,10 @@ class RegistryChecker:
         Returns:
             확장된 경로 (예: "C:\\Users\\username\\AppData\\Roaming\\npm")
         """
-        expanded = os.path.expandvars(path)
-        self.log(f"환경변수 확장: {path} → {expanded}")
+        expanded = _expand(path)
+        # 디버그 모드에서만 로그 (Machine/User 읽기가 병렬이므로 캐시 상태와 무관하게 매번 출력)
+        if self.log_callback and self._debug:
+            self.log(f"환경변수 확장: {path} → {expanded}")
         return expanded.lower()
 
     def get_machine_path(self) -> List[str]:
@@ -48,17 +127,20 @@ class RegistryChecker:
             list: List of machine-level PATH entries
         """
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment',
-                0,
-                winreg.KEY_READ
-            )
-            machine_path, _ = winreg.QueryValueEx(key, 'PATH')
-            winreg.CloseKey(key)
+            if self._hklm_key is not None:
+                machine_path, _ = winreg.QueryValueEx(self._hklm_key, 'PATH')
+            else:
+                key = winreg.OpenKey(
+                    winreg.HKEY_LOCAL_MACHINE,
+                    r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment',
+                    0,
+                    winreg.KEY_READ
+                )
+                machine_path, _ = winreg.QueryValueEx(key, 'PATH')
+                winreg.CloseKey(key)
             # 각 경로에 대해 환경변수 확장 적용
             expanded_paths = []
-            for p in machine_path.split(';'):
+            for p in machine_path.split(os.pathsep):
                 if p.strip():
                     expanded = self.expand_env_vars(p.strip())
                     expanded_paths.append(expanded)
@@ -75,17 +157,20 @@ class RegistryChecker:
             list: List of user-level PATH entries
         """
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                r'Environment',
-                0,
-                winreg.KEY_READ
-            )
-            user_path, _ = winreg.QueryValueEx(key, 'PATH')
-            winreg.CloseKey(key)
+            if self._hkcu_key is not None:
+                user_path, _ = winreg.QueryValueEx(self._hkcu_key, 'PATH')
+            else:
+                key = winreg.OpenKey(
+                    winreg.HKEY_CURRENT_USER,
+                    r'Environment',
+                    0,
+                    winreg.KEY_READ
+                )
+                user_path, _ = winreg.QueryValueEx(key, 'PATH')
+                winreg.CloseKey(key)
             # 각 경로에 대해 환경변수 확장 적용
             expanded_paths = []
-            for p in user_path.split(';'):
+            for p in user_path.split(os.pathsep):
                 if p.strip():
                     expanded = self.expand_env_vars(p.strip())
                     expanded_paths.append(expanded)
@@ -101,10 +186,19 @@ class RegistryChecker:
         Returns:
             dict: Machine and User PATH entries from registry
         """
-        return {
-            'Machine': self.get_machine_path(),
-            'User': self.get_user_path()
-        }
+        opened = self.open_keys()
+        try:
+            # Machine and User reads are independent; run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                machine = executor.submit(self.get_machine_path)
+                user = executor.submit(self.get_user_path)
+                return {
+                    'Machine': machine.result(),
+                    'User': user.result()
+                }
+        finally:
+            if opened:
+                self.close_keys()
 
     def check_executable_exists(self, tool_name: str, paths: List[str]) -> Tuple[bool, Optional[str]]:
         """
@@ -117,40 +211,40 @@ class RegistryChecker:
         Returns:
             tuple: (found, executable_path)
         """
-        for path_dir in paths:
-            if os.path.isdir(path_dir):
-                # Check for common executable extensions on Windows
-                for ext in ['', '.exe', '.cmd', '.bat']:
-                    exe_path = os.path.join(path_dir, tool_name + ext)
-                    if os.path.isfile(exe_path):
-                        return True, exe_path
-        return False, None
+        return self.find_executables({tool_name: tool_name}, paths)[tool_name]
 
-    def find_tool_paths(self, expected_paths: List[str], registry_paths: List[str]) -> List[str]:
+    def find_tool_paths(self, expected_paths: List[str], registry_paths: List[str],
+                        lc_paths: Optional[List[str]] = None) -> List[str]:
         """
         Find paths that match expected patterns
 
         Args:
             expected_paths: List of expected path patterns
             registry_paths: List of actual registry PATH entries
+            lc_paths: registry_paths already normalized for comparison (computed if None)
 
         Returns:
             list: Matching paths
         """
-        found_paths = []
-        for registry_path in registry_paths:
-            for expected in expected_paths:
-                if expected.lower() in registry_path.lower():
-                    found_paths.append(registry_path)
-        return found_paths
+        if lc_paths is None:
+            lc_paths = [_normalize(p) for p in registry_paths]
+        expected_lc = [os.path.normcase(expected) for expected in expected_paths]
+        return [
+            orig for orig, lc in zip(registry_paths, lc_paths)
+            if any(exp_lc in lc for exp_lc in expected_lc)
+        ]
 
-    def check_tool_in_registry(self, tool_name: str, command_info: Dict) -> Dict:
+    def check_tool_in_registry(self, tool_name: str, command_info: Dict,
+                               registry_paths: Optional[Dict[str, List[str]]] = None,
+                               executable: Optional[Tuple[bool, Optional[str]]] = None) -> Dict:
         """
         Check if tool exists in registry PATH
 
         Args:
             tool_name: Name of the tool
             command_info: Tool config with 'command' and 'expected_paths'
+            registry_paths: Result of get_registry_paths() to reuse (read if None)
+            executable: Precomputed check_executable_exists() result (searched if None)
 
         Returns:
             {
@@ -163,15 +257,18 @@ class RegistryChecker:
                 'user_paths': List[str]
             }
         """
-        registry_paths = self.get_registry_paths()
+        if registry_paths is None:
+            registry_paths = self.get_registry_paths()
         all_paths = registry_paths['Machine'] + registry_paths['User']
+        lc_paths = [_normalize(p) for p in all_paths]
 
         expected_paths = command_info.get('expected_paths', [])
-        found_paths = self.find_tool_paths(expected_paths, all_paths)
+        found_paths = self.find_tool_paths(expected_paths, all_paths, lc_paths)
 
         # Check for executable file
-        command = command_info['command']
-        executable_found, executable_path = self.check_executable_exists(command, all_paths)
+        if executable is None:
+            executable = self.check_executable_exists(command_info['command'], all_paths)
+        executable_found, executable_path = executable
 
         return {
             'tool': tool_name,
@@ -183,5 +280,65 @@ class RegistryChecker:
             'user_paths': registry_paths['User']
         }
 
+    def find_executables(self, commands: Dict[str, str],
+                         paths: List[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """
+        Find executables for several commands with one directory listing per path
+
+        Each PATH directory is listed once (concurrently) and every command is
+        matched against the listing, first directory / extension winning as in
+        a PATH search.
+
+        Args:
+            commands: Mapping of tool name to executable name
+            paths: List of directory paths to search
+
+        Returns:
+            dict: Mapping of tool name to (found, executable_path)
+        """
+        # Same directory spelled differently (case, trailing separator) is listed once,
+        # keeping PATH order
+        dirs = []
+        seen = set()
+        for path_dir in paths:
+            key = _normalize(path_dir)
+            if key not in seen:
+                seen.add(key)
+                dirs.append(path_dir)
+        with ThreadPoolExecutor() as executor:
+            listings = list(executor.map(_dir_file_names, dirs))
+
+        results = {}
+        for tool_name, command in commands.items():
+            results[tool_name] = (False, None)
+            candidates = [(command + ext, command.lower() + ext) for ext in EXE_SUFFIXES]
+            for path_dir, names in zip(dirs, listings):
+                match = next((name for name, lc in candidates if lc in names), None)
+                if match:
+                    results[tool_name] = (True, os.path.join(path_dir, match))
+                    break
+        return results
+
+    def check_tools_in_registry(self, tools: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Check several tools against registry PATH with a single registry read
+
+        Args:
+            tools: Mapping of tool name to tool config (see check_tool_in_registry)
+
+        Returns:
+            dict: Mapping of tool name to check_tool_in_registry() result
+        """
+        registry_paths = self.get_registry_paths()
+        executables = self.find_executables(
+            {tool_name: info['command'] for tool_name, info in tools.items()},
+            registry_paths['Machine'] + registry_paths['User']
+        )
+        return {
+            tool_name: self.check_tool_in_registry(tool_name, command_info, registry_paths,
+                                                   executables[tool_name])
+            for tool_name, command_info in tools.items()
+        }
+
 
 __all__ = ['RegistryChecker']
@@ -4,15 +4,74 @@ Executes tools in new process for verification
 Brain Module System v4.0
 """
 
+import base64
+import shutil
 import subprocess
 import os
+import threading
+import winreg
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, List, Any
 
-try:
-    from modules.core.config import Config
-    _config = Config()
-except Exception:
-    _config = None
+
+@lru_cache(maxsize=1)
+def _get_config():
+    """Config for production mode detection, created on first use"""
+    try:
+        from modules.core.config import Config
+        return Config()
+    except Exception:
+        # Fallback if Config is not available or initialization fails
+        return None
+
+
+@lru_cache(maxsize=1)
+def _flags():
+    """Subprocess creation flags, resolved once (no console without Config: probe output is captured anyway)"""
+    config = _get_config()
+    return config.get_subprocess_flags() if config else subprocess.CREATE_NO_WINDOW
+
+
+# Fresh Machine + User PATH from the registry, prepended to every probe script
+_PATH_PRELUDE = """
+$ErrorActionPreference = 'SilentlyContinue'
+$MachinePath = [Environment]::GetEnvironmentVariable('PATH', 'Machine')
+$UserPath = [Environment]::GetEnvironmentVariable('PATH', 'User')
+$env:PATH = "$MachinePath;$UserPath"
+"""
+
+
+def _registry_path() -> str:
+    """Machine + User PATH from the registry, expanded as a new process would see it"""
+    parts = []
+    for root, subkey in ((winreg.HKEY_LOCAL_MACHINE, r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment'),
+                         (winreg.HKEY_CURRENT_USER, r'Environment')):
+        try:
+            with winreg.OpenKey(root, subkey) as key:
+                value, _ = winreg.QueryValueEx(key, 'PATH')
+            parts.append(winreg.ExpandEnvironmentStrings(value))
+        except OSError:
+            pass
+    return ';'.join(parts)
+
+
+# Successful probe results for the current registry PATH, keyed by tool name.
+# Any PATH change (compared as the PATH string itself) drops the whole cache; failures
+# are never cached, so a tool installed into a directory already on PATH is still re-probed
+_result_cache: Dict[str, Dict[str, Any]] = {}
+_result_cache_path = None
+_result_cache_lock = threading.Lock()
+
+
+def _cached_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """Successful-result cache for this registry PATH (reset when the PATH changes)"""
+    global _result_cache_path
+    with _result_cache_lock:
+        if path != _result_cache_path:
+            _result_cache.clear()
+            _result_cache_path = path
+    return _result_cache
 
 
 class ToolExecutor:
@@ -40,6 +99,23 @@ class ToolExecutor:
         Returns:
             dict: Result with tool, status, version, command
         """
+        path = _registry_path()
+        cache = _cached_results(path)
+        if tool_name in cache:
+            return dict(cache[tool_name])
+
+        result = self._execute_tool_uncached(tool_name, command_info, path)
+        if result['status'] == 'success':
+            cache[tool_name] = dict(result)
+        return result
+
+    def _execute_tool_uncached(self, tool_name: str, command_info: Dict[str, Any],
+                               path: str) -> Dict[str, Any]:
+        """Probe one tool: directly on the registry PATH, else through PowerShell"""
+        direct = self._execute_direct(tool_name, command_info, path)
+        if direct is not None:
+            return direct
+
         try:
             command = command_info['command']
 
@@ -47,14 +123,12 @@ class ToolExecutor:
             ps_command = self.generate_powershell_command(command, command_info['args'])
 
             # Execute in new process
-            creationflags = self._get_subprocess_flags()
-
             result = subprocess.run(
-                ['powershell', '-NoProfile', '-Command', ps_command],
+                ['powershell', '-NoProfile', '-NonInteractive', '-Command', ps_command],
                 capture_output=True,
                 text=True,
                 timeout=10,
-                creationflags=creationflags
+                creationflags=_flags()
             )
 
             # Parse result
@@ -94,12 +168,7 @@ class ToolExecutor:
     def generate_powershell_command(self, command: str, args: List[str]) -> str:
         """Generate PowerShell command for tool execution"""
         args_str = ' '.join(args)
-        base_script = """
-$ErrorActionPreference = 'SilentlyContinue'
-$MachinePath = [Environment]::GetEnvironmentVariable('PATH', 'Machine')
-$UserPath = [Environment]::GetEnvironmentVariable('PATH', 'User')
-$env:PATH = "$MachinePath;$UserPath"
-"""
+        base_script = _PATH_PRELUDE
 
         if os.name == 'nt' and command in ['npm', 'claude']:
             return base_script + f"""
@@ -114,11 +183,161 @@ $result = & {command} {args_str} 2>&1
 if ($LASTEXITCODE -eq 0) {{ Write-Output $result; exit 0 }} else {{ Write-Output "NOTFOUND"; exit 1 }}
 """
 
-    def _get_subprocess_flags(self) -> int:
-        """Get subprocess creation flags from config"""
-        if _config:
-            return _config.get_subprocess_flags()
-        return subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NO_WINDOW
+    def execute_tools_batch(self, tools: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute all tools in new processes to verify PATH access
+
+        Tools found on the registry PATH are run directly; any others are probed
+        in one PowerShell process where each tool reports an
+        'index|ok|base64(output)' line, so the engine start-up cost is paid once.
+
+        Args:
+            tools: Mapping of tool name to dict with 'command' and 'args'
+
+        Returns:
+            dict: Tool name -> result in execute_tool() format
+        """
+        if not tools:
+            return {}
+
+        # Tools resolvable on the registry PATH run directly and concurrently;
+        # only the rest fall back to the PowerShell batch
+        path = _registry_path()
+        cache = _cached_results(path)
+        output = {name: dict(cache[name]) for name in tools if name in cache}
+        pending = {name: info for name, info in tools.items() if name not in output}
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                direct = dict(zip(pending, executor.map(
+                    lambda item: self._execute_direct(item[0], item[1], path), pending.items()
+                )))
+
+            fallback = {name: info for name, info in pending.items() if direct[name] is None}
+            results = self._execute_tools_powershell(fallback) if fallback else {}
+            for name in pending:
+                output[name] = direct[name] or results[name]
+                if output[name]['status'] == 'success':
+                    cache[name] = dict(output[name])
+
+        return {name: output[name] for name in tools}
+
+    def _execute_direct(self, tool_name: str, command_info: Dict[str, Any],
+                        path: str) -> Optional[Dict[str, Any]]:
+        """
+        Run the tool's executable directly (no PowerShell) with the given PATH
+
+        Returns:
+            dict: Result in execute_tool() format, or None if not found on path
+        """
+        command = command_info['command']
+        exe = None
+        if os.name == 'nt' and command in ['npm', 'claude']:
+            exe = shutil.which(f"{command}.cmd", path=path)
+        exe = exe or shutil.which(command, path=path)
+        if exe is None:
+            return None
+
+        try:
+            process = subprocess.Popen(
+                [exe, *command_info['args']],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                env={**os.environ, 'PATH': path},
+                creationflags=_flags()
+            )
+        except OSError:
+            return None
+
+        # stdout is drained to EOF on a helper thread so the tool never writes into a
+        # closed pipe; stderr is discarded so warnings are never taken as the version
+        lines = []
+
+        def drain_stdout():
+            try:
+                for line in process.stdout:
+                    lines.append(line)
+            except (OSError, ValueError):
+                pass
+            finally:
+                process.stdout.close()
+
+        reader = threading.Thread(target=drain_stdout, daemon=True)
+        reader.start()
+
+        try:
+            returncode = process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            return {'tool': tool_name, 'status': 'timeout', 'version': None, 'command': command}
+
+        # EOF normally follows the exit; a grandchild of npm.cmd holding the pipe
+        # only delays it, and the version line has been read by then
+        reader.join(timeout=1)
+
+        # --version prints the version on the first non-empty stdout line
+        version = next((line.strip() for line in list(lines) if line.strip()), '')
+        if returncode == 0 and version:
+            return {'tool': tool_name, 'status': 'success', 'version': version, 'command': command}
+        return {'tool': tool_name, 'status': 'not_found', 'version': None, 'command': command}
+
+    def _execute_tools_powershell(self, tools: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """One PowerShell process probing every tool (see execute_tools_batch)"""
+        names = list(tools)
+        script = _PATH_PRELUDE + ''.join(
+            self._generate_probe_block(i, tools[name]['command'], tools[name]['args'])
+            for i, name in enumerate(names)
+        )
+
+        def make_result(name, status, version=None, **extra):
+            return {'tool': name, 'status': status, 'version': version,
+                    'command': tools[name]['command'], **extra}
+
+        try:
+            result = subprocess.run(
+                ['powershell', '-NoProfile', '-NonInteractive', '-Command', script],
+                capture_output=True,
+                text=True,
+                timeout=10 * len(names),
+                creationflags=_flags()
+            )
+        except subprocess.TimeoutExpired:
+            return {name: make_result(name, 'timeout') for name in names}
+        except Exception as e:
+            return {name: make_result(name, 'error', error=str(e)) for name in names}
+
+        results = {name: make_result(name, 'not_found') for name in names}
+        for line in result.stdout.splitlines():
+            index, sep, rest = line.strip().partition('|')
+            ok, sep2, encoded = rest.partition('|')
+            if not (sep and sep2 and index.isdigit() and int(index) < len(names)):
+                continue
+            output = base64.b64decode(encoded).decode('utf-8', 'replace').replace('\r\n', '\n').strip()
+            if ok == 'True' and output and 'NOTFOUND' not in output:
+                name = names[int(index)]
+                results[name] = make_result(name, 'success', output)
+        return results
+
+    def _generate_probe_block(self, index: int, command: str, args: List[str]) -> str:
+        """PowerShell block for one tool in execute_tools_batch()"""
+        args_str = ' '.join(args)
+        # LASTEXITCODE is reset per attempt: a missing command leaves it untouched
+        attempts = [command]
+        if os.name == 'nt' and command in ['npm', 'claude']:
+            attempts.insert(0, f"{command}.cmd")
+        block = "$ok = $false; $result = $null\n"
+        for exe in attempts:
+            block += (
+                f"if (-not $ok) {{ $global:LASTEXITCODE = $null; "
+                f"$result = & {exe} {args_str} 2>&1; $ok = ($LASTEXITCODE -eq 0) }}\n"
+            )
+        block += (
+            f"Write-Output (\"{index}|$ok|\" + [Convert]::ToBase64String("
+            "[Text.Encoding]::UTF8.GetBytes(($result | Out-String).Trim())))\n"
+        )
+        return block
 
 
 __all__ = ['ToolExecutor']
@@ -7,10 +7,10 @@ Brain Module System v4.0
 import tkinter as tk
 from tkinter import ttk
 import threading
-import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
-import tempfile
-import os
+import base64
 from typing import Callable, Optional, List, Dict, Any
 
 
@@ -23,6 +23,7 @@ class VerificationUI:
         self.verify_window = None
         self.status_labels = {}
         self.results = []
+        self._result_queue = queue.Queue()
 
     def show_verification_window(self, parent_window: Optional[tk.Tk] = None) -> List[Dict[str, Any]]:
         """Show verification progress window"""
@@ -85,32 +86,68 @@ class VerificationUI:
                                 state='disabled')
         close_button.pack(pady=10)
 
-        # Start verification
-        threading.Thread(target=lambda: self._run_verification(progress_bar, result_text, close_button),
-                        daemon=True).start()
+        # Start verification; results are drained on the Tk thread
+        threading.Thread(target=self._run_verification, daemon=True).start()
+        self.verify_window.after(100, self._drain_queue, progress_bar, result_text, close_button)
 
-    def _run_verification(self, progress_bar, result_text, close_button):
-        """Run verification in background"""
+    def _run_verification(self):
+        """Run verification in background (never touches Tk widgets)"""
         self.results = []
-
-        for tool_name, command_info in self.verifier.tools.items():
-            result = self.verifier.verify_single_tool(tool_name, command_info)
-            self.results.append(result)
-
-            self.verify_window.after(0, lambda t=tool_name, r=result:
-                                    self._update_status(t, r, result_text))
-            time.sleep(0.5)
-
-        self.verify_window.after(0, lambda: self._finalize(progress_bar, result_text, close_button))
-
-    def _update_status(self, tool_name: str, result: Dict[str, Any], result_text: tk.Text):
-        """Update tool status"""
+        tools = self.verifier.tools
+
+        # Probe all tools concurrently; each result is queued as soon as its probe returns
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            futures = []
+            for tool_name, command_info in tools.items():
+                future = executor.submit(self.verifier.verify_single_tool, tool_name, command_info)
+                future.add_done_callback(
+                    lambda f, t=tool_name: self._result_queue.put((t, f.result()))
+                )
+                futures.append(future)
+
+        self.results = [future.result() for future in futures]
+        self._result_queue.put(None)
+
+    def _drain_queue(self, progress_bar, result_text, close_button):
+        """Apply queued results on the Tk thread and reschedule until verification finishes"""
+        lines = []
+        finished = False
+        while True:
+            try:
+                item = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None:
+                finished = True
+                break
+
+            lines.append(self._update_status(item[0], item[1]))
+
+        # One insert per drain instead of one per tool
+        if lines:
+            self._append_text(result_text, ''.join(lines))
+
+        if finished:
+            self._finalize(progress_bar, result_text, close_button)
+            return
+
+        self.verify_window.after(100, self._drain_queue, progress_bar, result_text, close_button)
+
+    def _update_status(self, tool_name: str, result: Dict[str, Any]) -> str:
+        """Update tool status label and return its result line"""
         if result['status'] == 'success':
             self.status_labels[tool_name].config(text=f"정상 - {result['version']}", fg='#27AE60')
-            result_text.insert('end', f"[정상] {tool_name}: {result['version']}\n")
-        else:
-            self.status_labels[tool_name].config(text=f"실패 - {result['status']}", fg='#E74C3C')
-            result_text.insert('end', f"[실패] {tool_name}: {result['status']}\n")
+            return f"[정상] {tool_name}: {result['version']}\n"
+
+        self.status_labels[tool_name].config(text=f"실패 - {result['status']}", fg='#E74C3C')
+        return f"[실패] {tool_name}: {result['status']}\n"
+
+    def _append_text(self, result_text: tk.Text, text: str):
+        """Append to the read-only result text (kept disabled between writes)"""
+        result_text.config(state='normal')
+        result_text.insert('end', text)
+        result_text.config(state='disabled')
 
     def _finalize(self, progress_bar, result_text, close_button):
         """Finalize verification"""
@@ -122,7 +159,7 @@ class VerificationUI:
         total = len(self.results)
         summary = f"\n{'='*50}\n검증 완료: {success}/{total}개 도구가 작동 중\n"
         summary += "모든 도구가 정상적으로 구성되었습니다!" if success == total else "일부 도구에 문제가 있습니다."
-        result_text.insert('end', summary)
+        self._append_text(result_text, summary)
 
 
 class TerminalVerificationUI:
@@ -132,6 +169,7 @@ class TerminalVerificationUI:
         """Initialize terminal verification UI"""
         self.log_callback = log_callback
         self.config = config
+        self._creationflags = config.get_subprocess_flags() if config else 0
 
     def log(self, message: str):
         """Log a message"""
@@ -142,27 +180,22 @@ class TerminalVerificationUI:
     def open_verification_terminal(self):
         """Open new PowerShell terminal for manual verification"""
         script = self._get_verification_script()
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.ps1', delete=False) as f:
-            f.write(script)
-            script_path = f.name
+        # Pass the script inline so no temp .ps1 file has to be written and cleaned up
+        encoded = base64.b64encode(script.encode('utf-16-le')).decode('ascii')
 
         try:
-            creationflags = self.config.get_subprocess_flags() if self.config else 0
-            subprocess.run([
+            # The outer PowerShell only launches the elevated terminal, so fire and forget
+            subprocess.Popen([
                 'powershell', '-Command',
-                f"Start-Process powershell -ArgumentList '-NoExit', '-ExecutionPolicy', "
-                f"'Bypass', '-File', '{script_path}' -Verb RunAs"
-            ], creationflags=creationflags)
+                f"Start-Process powershell -ArgumentList '-NoExit', '-NoProfile', '-ExecutionPolicy', "
+                f"'Bypass', '-EncodedCommand', '{encoded}' -Verb RunAs"
+            ], creationflags=self._creationflags)
 
             self.log("수동 검증을 위한 새 터미널이 열렸습니다")
 
         except Exception as e:
             self.log(f"검증 터미널 열기 실패: {e}")
 
-        finally:
-            threading.Thread(target=lambda: self._cleanup_script(script_path), daemon=True).start()
-
     def _get_verification_script(self) -> str:
         """Get PowerShell verification script"""
         return '''
@@ -207,13 +240,5 @@ Write-Host "아무 키나 누르면 닫힙니다..." -ForegroundColor Yellow
 $null = $Host.UI.RawUI.ReadKey("NoEcho,IncludeKeyDown")
 '''
 
-    def _cleanup_script(self, script_path: str):
-        """Clean up temporary script file"""
-        time.sleep(5)
-        try:
-            os.unlink(script_path)
-        except:
-            pass
-
 
 __all__ = ['VerificationUI', 'TerminalVerificationUI']
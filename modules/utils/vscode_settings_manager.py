@@ -4,10 +4,62 @@ VSCode의 settings.json을 관리하고 터미널 PATH 설정을 자동 수정
 """
 
 import os
+import copy
 import json
 from pathlib import Path
 from typing import Optional
 
+# 읽기는 orjson이 있으면 사용 (표준 json보다 빠름), 없으면 표준 json으로 대체
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+
+def _dumps(obj: dict) -> bytes:
+    """settings.json 직렬화 - 설치된 패키지와 무관하게 항상 같은 형식(4칸 들여쓰기)"""
+    return json.dumps(obj, indent=4, ensure_ascii=False).encode('utf-8')
+
+
+# VSCode 터미널 PATH에 있어야 하는 필수 경로 (%APPDATA%는 import 시 한 번만 확장)
+REQUIRED_TERMINAL_PATHS = (
+    r'C:\Python312',
+    r'C:\Python312\Scripts',
+    r'C:\Program Files\Git\cmd',
+    r'C:\Program Files\Git\bin',
+    r'C:\Program Files\nodejs',
+    os.path.expandvars(r'%APPDATA%\npm')
+)
+
+
+def _existing_dirs(paths) -> set:
+    """
+    부모 디렉토리별로 os.scandir를 한 번씩만 호출해 존재하는 디렉토리 확인
+
+    Args:
+        paths: 확인할 디렉토리 경로 목록
+
+    Returns:
+        set: 실제로 존재하는 디렉토리 경로 집합
+    """
+    by_parent = {}
+    for path in paths:
+        by_parent.setdefault(os.path.dirname(path), []).append(path)
+
+    existing = set()
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                names = {entry.name.lower() for entry in it if entry.is_dir()}
+        except OSError:
+            continue
+        existing.update(p for p in children if os.path.basename(p).lower() in names)
+    return existing
+
 
 class VSCodeSettingsManager:
     """VSCode settings.json 관리 클래스"""
@@ -20,33 +72,61 @@ class VSCodeSettingsManager:
         else:
             self.settings_path = None
 
+        # VSCode 설치 확인 결과 (True인 경우만 유지)
+        self._vscode_installed = False
+
+        # settings.json 파싱 결과 캐시 (st_mtime_ns 기준 무효화)
+        self._cached_settings = None
+        self._cached_mtime = None
+        # 마지막으로 읽거나 저장한 파일 내용 (변경 없는 저장 생략용)
+        self._cached_raw = None
+
     def is_vscode_installed(self) -> bool:
         """
         VSCode 설치 여부 확인
 
+        설치 중에 VSCode가 처음 실행될 수 있으므로 설치된 것으로 확인된 경우만 기억
+
         Returns:
             bool: VSCode가 설치되어 있으면 True, 아니면 False
         """
+        if self._vscode_installed:
+            return True
         if not self.settings_path:
             return False
 
         # settings.json 파일이 없어도 User 폴더가 있으면 설치된 것으로 간주
-        user_dir = self.settings_path.parent
-        return user_dir.exists()
+        self._vscode_installed = os.path.isdir(self.settings_path.parent)
+        return self._vscode_installed
 
     def _read_settings(self) -> dict:
         """
         settings.json 파일 읽기
 
+        파일의 st_mtime_ns가 마지막으로 읽은 시점과 같으면 캐시된 결과의 사본을 반환
+
         Returns:
             dict: settings 내용, 파일이 없으면 빈 딕셔너리
         """
-        if not self.settings_path or not self.settings_path.exists():
+        if not self.settings_path:
+            return {}
+
+        try:
+            mtime = self.settings_path.stat().st_mtime_ns
+        except OSError:
             return {}
 
+        # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 항상 사본을 반환
+        if self._cached_settings is not None and mtime == self._cached_mtime:
+            return copy.deepcopy(self._cached_settings)
+
         try:
-            with open(self.settings_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            raw = self.settings_path.read_bytes()
+            settings = _loads(raw)
+            self._cached_settings = settings
+            self._cached_mtime = mtime
+            self._cached_raw = raw
+            return copy.deepcopy(settings)
         except Exception as e:
             print(f"settings.json 읽기 실패: {e}")
             return {}
@@ -61,15 +141,35 @@ class VSCodeSettingsManager:
         if not self.settings_path:
             return
 
+        data = _dumps(settings)
+
+        # 디스크 내용과 동일하면 쓰기 생략 (그 사이 외부에서 수정되지 않은 경우만)
+        if data == self._cached_raw:
+            try:
+                if self.settings_path.stat().st_mtime_ns == self._cached_mtime:
+                    return
+            except OSError:
+                pass
+
         # User 디렉토리가 없으면 생성
         self.settings_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # 같은 폴더의 임시 파일에 쓴 뒤 교체 (쓰기 중 중단되어도 settings.json이 손상되지 않음)
+        tmp_path = self.settings_path.with_suffix('.json.tmp')
         try:
-            with open(self.settings_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.settings_path)
+            # 실제로 저장된 내용으로 캐시 갱신
+            self._cached_settings = copy.deepcopy(settings)
+            self._cached_mtime = self.settings_path.stat().st_mtime_ns
+            self._cached_raw = data
             print(f"settings.json 저장 완료: {self.settings_path}")
         except Exception as e:
             print(f"settings.json 저장 실패: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
     def auto_fix_vscode_terminal_path(self):
         """
@@ -100,38 +200,34 @@ class VSCodeSettingsManager:
 
             current_path = env_settings['PATH']
 
-            # 필수 경로 정의
-            required_paths = [
-                r'C:\Python312',
-                r'C:\Python312\Scripts',
-                r'C:\Program Files\Git\cmd',
-                r'C:\Program Files\Git\bin',
-                r'C:\Program Files\nodejs',
-                os.path.expandvars(r'%APPDATA%\npm')
-            ]
-
             # 현재 PATH를 세미콜론으로 분리
             path_list = [p.strip() for p in current_path.split(';') if p.strip()]
 
-            # 대소문자 무시하고 비교하기 위해 소문자 버전 생성
-            path_list_lower = [p.lower() for p in path_list]
+            # 대소문자 무시하고 비교하기 위해 소문자 집합 생성
+            path_set_lower = {p.lower() for p in path_list}
 
             # 추가된 경로 추적
             added_paths = []
 
+            # 아직 PATH에 없는 필수 경로만 존재 여부 확인 (대소문자 무시)
+            missing_paths = [p for p in REQUIRED_TERMINAL_PATHS
+                             if p.lower() not in path_set_lower]
+            existing_paths = _existing_dirs(missing_paths) if missing_paths else set()
+
             # 각 필수 경로 확인
-            for req_path in required_paths:
+            for req_path in missing_paths:
                 # 경로가 실제로 존재하는지 확인
-                if not os.path.exists(req_path):
+                if req_path not in existing_paths:
                     continue
 
-                # 이미 PATH에 있는지 확인 (대소문자 무시)
-                if req_path.lower() in path_list_lower:
+                # 중복 항목 방지 (대소문자 무시)
+                req_lower = req_path.lower()
+                if req_lower in path_set_lower:
                     continue
 
                 # PATH에 추가
                 path_list.append(req_path)
-                path_list_lower.append(req_path.lower())
+                path_set_lower.add(req_lower)
                 added_paths.append(req_path)
 
             # 새로운 경로가 추가되었으면 저장
@@ -1,11 +1,23 @@
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+EXCLUDED_NAMES = ('__pycache__', 'build_auto', 'dist_auto')
+
 
 def count_lines_in_file(file_path):
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return len(f.readlines())
+        count = 0
+        last = b''
+        with open(file_path, 'rb') as f:
+            for buf in iter(lambda: f.read(1 << 20), b''):
+                count += buf.count(b'\n')
+                last = buf
+        # readlines()와 동일하게 개행 없이 끝나는 마지막 줄도 한 줄로 계산
+        if last and not last.endswith(b'\n'):
+            count += 1
+        return count
     except Exception:
         return 0
 
@@ -14,58 +26,51 @@ def collect_python_files(root_path):
     file_data = []
     total_lines = 0
 
-    root = Path(root_path)
+    root = os.fspath(root_path)
+    # os.walk 경로는 이미 문자열이므로 root 접두사만 잘라 상대 경로 부분을 구함
+    prefix_len = len(os.path.join(root, ''))
 
-    for py_file in sorted(root.rglob('*.py')):
-        if '__pycache__' in str(py_file) or 'build_auto' in str(py_file) or 'dist_auto' in str(py_file):
-            continue
+    py_files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        # 제외 디렉토리는 하위로 내려가지 않도록 제자리에서 제거
+        dirnames[:] = [d for d in dirnames if not any(name in d for name in EXCLUDED_NAMES)]
 
-        lines = count_lines_in_file(py_file)
-        total_lines += lines
+        rel_dir = dirpath[prefix_len:]
+        dir_parts = tuple(rel_dir.split(os.sep)) if rel_dir else ()
+
+        for filename in filenames:
+            if filename.endswith('.py') and not any(name in filename for name in EXCLUDED_NAMES):
+                py_files.append((dir_parts + (filename,), os.path.join(dirpath, filename)))
 
-        relative_path = py_file.relative_to(root)
-        file_data.append((relative_path, lines))
+    py_files.sort()
+
+    with ThreadPoolExecutor() as executor:
+        line_counts = list(executor.map(count_lines_in_file, (full_path for _, full_path in py_files)))
+
+    for (parts, _), lines in zip(py_files, line_counts):
+        total_lines += lines
+        file_data.append((parts, lines))
 
     return file_data, total_lines
 
 
 def build_directory_tree(file_data):
     tree = {}
+    dir_totals = defaultdict(int)
 
-    for file_path, lines in file_data:
-        parts = file_path.parts
+    for parts, lines in file_data:
         current = tree
+        dir_path = ''
 
-        for i, part in enumerate(parts):
-            if i == len(parts) - 1:
-                current[part] = lines
-            else:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-
-    return tree
-
-
-def calculate_dir_lines(tree):
-    totals = {}
-
-    def recurse(node, path=''):
-        total = 0
-        for key, value in node.items():
-            current_path = f"{path}/{key}" if path else key
-
-            if isinstance(value, int):
-                total += value
-            else:
-                subtotal = recurse(value, current_path)
-                total += subtotal
-                totals[current_path] = subtotal
+        for part in parts[:-1]:
+            # 트리를 만들면서 각 상위 디렉토리 합계도 함께 누적
+            dir_path = f"{dir_path}/{part}" if dir_path else part
+            dir_totals[dir_path] += lines
+            current = current.setdefault(part, {})
 
-        return total
+        current[parts[-1]] = lines
 
-    recurse(tree)
-    return totals
+    return tree, dir_totals
 
 
 def print_tree(tree, dir_totals, prefix='', path=''):
@@ -95,8 +100,7 @@ def main():
     print()
 
     file_data, total_lines = collect_python_files(root_path)
-    tree = build_directory_tree(file_data)
-    dir_totals = calculate_dir_lines(tree)
+    tree, dir_totals = build_directory_tree(file_data)
 
     print("new_ai_setup/")
     print_tree(tree, dir_totals, '', '')